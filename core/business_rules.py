@@ -10,48 +10,142 @@ Este módulo pode:
 """
 
 from __future__ import annotations
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+import functools
 import logging
-from pathlib import Path
-from typing import Dict, Tuple, Optional
+import os
+import random
+import time
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Número máximo de ICCIDs memorizados por _is_esim_cached
+ESIM_CACHE_SIZE = 8192
+
+
+# Tabela de tradução Luhn: dígito ASCII -> dígito ASCII do valor duplicado (2d ou 2d-9)
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", b"0246813579")
+
+
+def _luhn_valid(num_str: str) -> bool:
+    """Verifica se a string numérica passa o algoritmo de Luhn."""
+    if not (num_str.isascii() and num_str.isdigit()):
+        return False
+    digits = num_str.encode("ascii")
+    # parity = 0 se len even, 1 se odd -> posições a duplicar
+    parity = len(digits) % 2
+    # soma em C sobre os bytes: posições duplicadas via tabela + restantes; desconta '0' (48)
+    total = (
+        sum(digits[parity::2].translate(_LUHN_DOUBLED))
+        + sum(digits[1 - parity::2])
+        - 48 * len(digits)
+    )
+    return total % 10 == 0
+
+
+def _luhn_valid_many(digits: List[str]):
+    """
+    Luhn vetorizado (NumPy) para ICCIDs ASCII numéricos, todos com o mesmo comprimento.
+    Devolve um array booleano alinhado com `digits`.
+    """
+    import numpy as np
+
+    size = len(digits[0])
+    matrix = np.frombuffer("".join(digits).encode("ascii"), dtype=np.uint8).reshape(-1, size) - 48
+    # parity = 0 se len even, 1 se odd -> colunas a duplicar
+    parity = size % 2
+    doubled = matrix[:, parity::2] * 2
+    doubled = np.where(doubled > 9, doubled - 9, doubled)
+    total = doubled.sum(axis=1) + matrix[:, 1 - parity::2].sum(axis=1)
+    return total % 10 == 0
+
+
+@functools.lru_cache(maxsize=ESIM_CACHE_SIZE)
+def _is_esim_cached(start_b: bytes, end_b: bytes, iccid_s: str) -> bool:
+    """
+    Núcleo puro de EsimRange.is_esim, memorizado por (start, end, ICCID).
+    Espera um ICCID já normalizado (strip + apenas dígitos ASCII) e limites válidos.
+    """
+    iccid_b = iccid_s.encode("ascii")
+
+    # caso normal: mesmos comprimentos -> comparar por bytes (mais seguro para IDs)
+    if len(iccid_b) == len(start_b) == len(end_b):
+        in_range = start_b <= iccid_b <= end_b
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Same-length compare -> %s %s", iccid_s, "in" if in_range else "out")
+        return in_range
+
+    # caso comum no teu ambiente: iccid tem 1 dígito extra (Luhn)
+    if len(iccid_b) == len(start_b) + 1 and _luhn_valid(iccid_s):
+        candidate = iccid_b[:-1]  # remove dígito Luhn
+        in_range = start_b <= candidate <= end_b
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Detected Luhn-digit ICCID; comparing '%s' against ranges", candidate.decode())
+            logger.debug("After stripping Luhn: %s %s", candidate.decode(), "dentro" if in_range else "fora")
+        return in_range
+
+    # fallback: comparação numérica (suporta comprimentos diferentes, mas com cuidado)
+    in_range = int(start_b) <= int(iccid_s) <= int(end_b)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Numeric fallback -> %s %s", iccid_s, "dentro" if in_range else "fora")
+    return in_range
 
-from helpers.configuration import load_json_config
-from helpers.logger_manager import LoggerManager
 
 # -----------------------------
 # Data classes das regras
 # -----------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EsimRange:
-    """Representa o intervalo válido de ICCID eSIM."""
-
-    def __init__(self, start: int, end: int):
-        """Initialize the orchestrator with configuration."""
-
-        # Setup logging
-        self.logger_manager = LoggerManager()
-        self.logger = logging.getLogger(__name__)
-
-        # Intervalo de ICCID para eSIM
-        self.start = start
-        self.end = end
+    """Representa o intervalo válido de ICCID eSIM (imutável e hashable)."""
+    start: int
+    end: int
+
+    # Limites pré-calculados uma única vez: is_esim compara bytes ASCII
+    # (memcmp) em vez de converter start/end em cada chamada
+    _start_b: bytes = field(init=False, repr=False, compare=False)
+    _end_b: bytes = field(init=False, repr=False, compare=False)
+    _bounds_valid: bool = field(init=False, repr=False, compare=False)
+    # Prefixo comum a start/end (ex.: '89238010000101') e comprimento dos limites
+    _prefix: str = field(init=False, repr=False, compare=False)
+    _len: int = field(init=False, repr=False, compare=False)
+    # Especialização para ICCIDs com o comprimento fixo dos limites (start/end com o mesmo comprimento)
+    _same_len: bool = field(init=False, repr=False, compare=False)
+    _start_s: str = field(init=False, repr=False, compare=False)
+    _end_s: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        start_b = str(self.start).strip().encode("ascii", "replace")
+        end_b = str(self.end).strip().encode("ascii", "replace")
+        object.__setattr__(self, "_start_b", start_b)
+        object.__setattr__(self, "_end_b", end_b)
+        object.__setattr__(self, "_bounds_valid", start_b.isdigit() and end_b.isdigit())
+        object.__setattr__(self, "_len", len(start_b))
+        object.__setattr__(self, "_same_len", len(start_b) == len(end_b))
+        object.__setattr__(self, "_start_s", start_b.decode("ascii"))
+        object.__setattr__(self, "_end_s", end_b.decode("ascii"))
+
+        # O prefixo só é fiável para rejeição quando start/end têm o mesmo comprimento
+        # e não começam por zero (caso contrário o fallback numérico pode aceitar o ICCID)
+        prefix = ""
+        if len(start_b) == len(end_b) and not start_b.startswith(b"0"):
+            prefix = os.path.commonprefix([start_b, end_b]).decode("ascii", "replace")
+        object.__setattr__(self, "_prefix", prefix)
+
+    def _outside_prefix(self, iccid_s: str) -> bool:
+        """
+        Rejeição O(1) de ICCIDs com comprimento L (comparação direta) ou L+1 (dígito Luhn)
+        que não partilham o prefixo comum do intervalo; evita ocupar a cache LRU com
+        a maioria de cartões não-eSIM.
+        """
+        if not self._prefix or iccid_s.startswith(self._prefix):
+            return False
+        extra = len(iccid_s) - self._len
+        return extra == 0 or (extra == 1 and iccid_s[0] != "0")
 
     def luhn_valid(self, num_str: str) -> bool:
         """Verifica se a string numérica passa o algoritmo de Luhn."""
-        if not num_str.isdigit():
-            return False
-        total = 0
-        # parity = 0 se len even, 1 se odd -> padrão de duplicação
-        parity = len(num_str) % 2
-        for i, ch in enumerate(num_str):
-            d = int(ch)
-            if i % 2 == parity:
-                d *= 2
-                if d > 9:
-                    d -= 9
-            total += d
-        return total % 10 == 0
+        return _luhn_valid(num_str)
 
     def is_esim(self, iccid: Optional[str]) -> bool:
         """
@@ -60,57 +154,92 @@ class EsimRange:
         - Se iccid tiver 1 dígito a mais que start/end e o último for Luhn válido, corta o último dígito antes da comparação.
         - Aceita strings (com zeros à esquerda preservados).
         - Retorna False para valores None, vazios ou não numéricos.
+        - Resultados memorizados numa cache LRU limitada (ESIM_CACHE_SIZE).
         """
         if not iccid:
-            self.logger.debug("ICCID vazio ou None.")
+            logger.debug("ICCID vazio ou None.")
             return False
 
-        iccid_s = str(iccid).strip()
-        if not iccid_s.isdigit():
-            self.logger.debug(f"ICCID inválido (não numérico): '{iccid_s}'")
+        iccid_s = iccid.strip() if isinstance(iccid, str) else str(iccid).strip()
+        if not (iccid_s.isascii() and iccid_s.isdigit()):
+            logger.debug("ICCID inválido (não numérico): '%s'", iccid_s)
             return False
 
-        # normaliza start/end como strings
-        start_s = str(getattr(self, "start", "")).strip()
-        end_s = str(getattr(self, "end", "")).strip()
-
-        if not (start_s.isdigit() and end_s.isdigit()):
-            self.logger.error(f"Start/End inválidos: start='{start_s}' end='{end_s}'")
+        if not self._bounds_valid:
+            logger.error("Start/End inválidos: start='%s' end='%s'", self.start, self.end)
             return False
 
-        # caso normal: mesmos comprimentos -> comparar por string (mais seguro para IDs)
-        if len(iccid_s) == len(start_s) == len(end_s):
-            in_range = start_s <= iccid_s <= end_s
-            self.logger.debug(f"Same-length compare -> {iccid_s} {'in' if in_range else 'out'}")
-            return in_range
-
-        # caso comum no teu ambiente: iccid tem 1 dígito extra (Luhn)
-        if len(iccid_s) == len(start_s) + 1 and self.luhn_valid(iccid_s):
-            candidate = iccid_s[:-1]  # remove dígito Luhn
-            self.logger.debug(f"Detected Luhn-digit ICCID; comparing '{candidate}' against ranges")
-            in_range = start_s <= candidate <= end_s
-            self.logger.debug(f"After stripping Luhn: {candidate} {'dentro' if in_range else 'fora'}")
-            return in_range
-
-        # fallback: tenta comparação numérica (suporta comprimentos diferentes, mas com cuidado)
-        try:
-            iccid_i = int(iccid_s)
-            start_i = int(start_s)
-            end_i = int(end_s)
-        except ValueError:
-            self.logger.debug("Falha ao converter para int durante fallback.")
+        if self._outside_prefix(iccid_s):
             return False
 
-        in_range = start_i <= iccid_i <= end_i
-        self.logger.debug(f"Numeric fallback -> {iccid_s} {'dentro' if in_range else 'fora'}")
-        return in_range
+        # caminho especializado (comprimento fixo L): comparação direta de str — para dígitos ASCII
+        # do mesmo comprimento a ordem lexicográfica é a numérica — sem encode nem consulta à cache
+        if self._same_len and len(iccid_s) == self._len:
+            return self._start_s <= iccid_s <= self._end_s
+
+        return _is_esim_cached(self._start_b, self._end_b, iccid_s)
+
+    def is_esim_many(self, iccids: Iterable[Optional[str]]) -> List[bool]:
+        """
+        Versão em lote de is_esim (ex.: coluna de um DataFrame), com o mesmo resultado elemento a elemento.
+        - ICCIDs numéricos com o comprimento de start/end são avaliados de forma vetorizada (pandas).
+        - ICCIDs com dígito Luhn extra são validados em bloco (NumPy) e comparados sem o último dígito.
+        - Os restantes (outros comprimentos, Luhn inválido) seguem por is_esim.
+        """
+        values = [v if v is None or isinstance(v, str) else str(v) for v in iccids]
+        if not values:
+            return []
+
+        if not self._bounds_valid:
+            logger.error("Start/End inválidos: start='%s' end='%s'", self.start, self.end)
+            return [False] * len(values)
+
+        if not self._same_len:
+            return [self.is_esim(v) for v in values]
 
-@dataclass
+        import pandas as pd
+
+        series = pd.Series(values, dtype="string").str.strip()
+        numeric = series.str.fullmatch(r"[0-9]+").fillna(False).astype(bool)
+        same_len = series.str.len().eq(self._len).fillna(False).astype(bool)
+        start_s, end_s = self._start_s, self._end_s
+        in_range = ((series >= start_s) & (series <= end_s)).fillna(False).astype(bool)
+
+        result = (numeric & same_len & in_range).tolist()
+
+        luhn_len = numeric & series.str.len().eq(self._len + 1).fillna(False).astype(bool)
+        luhn_idx = luhn_len.to_numpy().nonzero()[0]
+        if len(luhn_idx):
+            candidates = [series.iat[i] for i in luhn_idx]
+            for i, iccid_s, luhn_ok in zip(luhn_idx, candidates, _luhn_valid_many(candidates)):
+                result[i] = start_s <= iccid_s[:-1] <= end_s if luhn_ok else self.is_esim(values[i])
+
+        for i in (numeric & ~same_len & ~luhn_len).to_numpy().nonzero()[0]:
+            result[i] = self.is_esim(values[i])
+        return result
+
+@dataclass(slots=True, frozen=True)
 class RetryPolicy:
     """Define parâmetros de retentativa de chamadas API."""
     max_attempts: int = 3
     delay_seconds: float = 5.0
     backoff_factor: float = 2.0  # multiplicador exponencial
+    max_delay: float = 30.0  # limite superior do delay base
+    jitter: float = 0.5  # variação aleatória relativa (±jitter) para evitar retentativas sincronizadas
+
+    # Tabela de delays base (já limitados por max_delay) para as tentativas 1..max_attempts
+    _delays: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        delays = tuple(
+            self._base_delay(attempt)
+            for attempt in range(1, max(int(self.max_attempts), 1) + 1)
+        )
+        object.__setattr__(self, "_delays", delays)
+
+    def _base_delay(self, attempt: int) -> float:
+        """delay_seconds * backoff_factor ** (attempt - 1), limitado por max_delay."""
+        return min(float(self.max_delay), float(self.delay_seconds) * (float(self.backoff_factor) ** (attempt - 1)))
 
     def can_retry(self, attempt: int) -> bool:
         """
@@ -125,47 +254,85 @@ class RetryPolicy:
     def next_delay(self, attempt: int) -> float:
         """
         Calcula o tempo de espera antes da próxima tentativa.
-        Fórmula: delay_seconds * (backoff_factor ** (attempt - 1))
+        Fórmula: min(max_delay, delay_seconds * backoff_factor ** (attempt - 1)) * (1 ± jitter)
         - attempt: tentativa atual (1-based). Para attempt=1 -> delay_seconds * backoff_factor**0 = delay_seconds
+        - jitter=0 torna o resultado determinístico
         """
         if attempt <= 0:
             attempt = 1
-        return float(self.delay_seconds) * (float(self.backoff_factor) ** (attempt - 1))
+        if attempt <= len(self._delays):
+            base = self._delays[attempt - 1]
+        else:
+            base = self._base_delay(attempt)
+        if not self.jitter:
+            return base
+        return base * (1.0 + random.uniform(-self.jitter, self.jitter))
+
+
+# Prefixo "YYYY-MM-DDTHH:MM:SS" do último segundo formatado (reutilizado dentro do mesmo segundo)
+_ts_cache: Tuple[int, str] = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """Timestamp UTC ISO-8601 com microssegundos e sufixo 'Z', sem criar objetos datetime."""
+    global _ts_cache
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}Z"
+
+
+class ErrorPayload(NamedTuple):
+    """Erro estruturado devolvido por ErrorHandler.handle_error (usar _asdict() para JSON/BD)."""
+    status: str
+    context: str
+    error_type: str
+    error_message: str
+    timestamp: str
 
 
 class ErrorHandler:
     """Implementa tratamento genérico de erros conforme RN-ERR-01."""
 
     @staticmethod
-    def handle_error(error: Exception, context: str = "", raise_on_debug: bool = False) -> Dict:
+    def handle_error(error: Exception, context: str = "", raise_on_debug: bool = False) -> ErrorPayload:
         """
-        Regista e devolve um dicionário estruturado de erro.
+        Regista e devolve um ErrorPayload estruturado de erro.
         - context: string com contexto (ex.: 'API RSP', 'Parser XML')
         - raise_on_debug: se True, re-levanta a exceção (útil em dev)
         """
-        payload = {
-            "status": "failed",
-            "context": context,
-            "error_type": type(error).__name__,
-            "error_message": str(error),
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-        }
         if raise_on_debug:
             raise error
-        return payload
+        return ErrorPayload(
+            status="failed",
+            context=context,
+            error_type=type(error).__name__,
+            error_message=str(error),
+            timestamp=utc_timestamp(),
+        )
 
 
 
 
+# Regras por defeito (coerentes com o PDD/POP); imutáveis, partilhadas por todos os chamadores
+_DEFAULT_ESIM_RANGE = EsimRange(start=89238010000101000000, end=89238010000101999999)
+_DEFAULT_RETRY = RetryPolicy()
+
+
 def rules_from_config(config: Dict) -> Tuple[EsimRange, RetryPolicy]:
     """
     Cria EsimRange e RetryPolicy a partir do dicionário de configuração.
     Espera a estrutura similar a:
     {
-        "retry_policy": {"max_retries": 3, "delay_seconds": 5, "backoff_factor": 2},
+        "retry_policy": {"max_retries": 3, "delay_seconds": 5, "backoff_factor": 2, "max_delay": 30, "jitter": 0.5},
         "esim_range": {"start": 892380..., "end": 892380...}
     }
     """
+    if not config:
+        return _DEFAULT_ESIM_RANGE, _DEFAULT_RETRY
+
     # valores por defeito coerentes com o PDD/POP
     retry_cfg = config.get("retry_policy", {}) if isinstance(config, dict) else {}
     esim_cfg = config.get("esim_range", {}) if isinstance(config, dict) else {}
@@ -173,21 +340,35 @@ def rules_from_config(config: Dict) -> Tuple[EsimRange, RetryPolicy]:
     max_retries = int(retry_cfg.get("max_retries", retry_cfg.get("max_attempts", 3)))
     delay_seconds = float(retry_cfg.get("delay_seconds", retry_cfg.get("delay", 5.0)))
     backoff_factor = float(retry_cfg.get("backoff_factor", retry_cfg.get("backoff", 2.0)))
+    max_delay = float(retry_cfg.get("max_delay", 30.0))
+    jitter = float(retry_cfg.get("jitter", 0.5))
 
     start = int(esim_cfg.get("start", 89238010000101000000))
     end = int(esim_cfg.get("end", 89238010000101999999))
 
     esim_range = EsimRange(start=start, end=end)
-    retry_policy = RetryPolicy(max_attempts=max_retries, delay_seconds=delay_seconds, backoff_factor=backoff_factor)
+    retry_policy = RetryPolicy(
+        max_attempts=max_retries,
+        delay_seconds=delay_seconds,
+        backoff_factor=backoff_factor,
+        max_delay=max_delay,
+        jitter=jitter,
+    )
 
     return esim_range, retry_policy
 
 
+@functools.lru_cache(maxsize=4)
 def get_default_rules(config_path: Optional[str] = None) -> Tuple[EsimRange, RetryPolicy]:
     """
     Tenta carregar as regras a partir do ficheiro de configuração.
     - Se não encontrar ficheiro/config, retorna regras por defeito.
+    - O resultado é memorizado por config_path; as instâncias devolvidas são
+      partilhadas entre chamadas (usar invalidate_rules_cache() para recarregar).
     """
+    # import tardio: helpers/__init__ arrasta email, BD e psycopg2, desnecessários para EsimRange/RetryPolicy
+    from helpers.configuration import load_json_config
+
     cfg = load_json_config(config_path)
 
     if not cfg:
@@ -196,6 +377,11 @@ def get_default_rules(config_path: Optional[str] = None) -> Tuple[EsimRange, Ret
     return rules_from_config(cfg)
 
 
+def invalidate_rules_cache() -> None:
+    """Limpa a cache de get_default_rules() (testes ou recarga de configs.json)."""
+    get_default_rules.cache_clear()
+
+
 # -----------------------------
 # Módulo executável (exemplos)
 # -----------------------------
@@ -1,138 +1,428 @@
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
-import json
-import uuid
+import orjson
 import time
+import binascii
+import functools
 import hashlib
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from tenacity import retry, stop_after_attempt, wait_exponential
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from tenacity import (
+    Retrying, retry, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
+)
 from dotenv import load_dotenv
 
+from core.business_rules import RetryPolicy, utc_timestamp
+
 logger = logging.getLogger(__name__)
 
+# Endpoints da plataforma RSP (constantes de módulo: não são realocadas por chamada)
+EP_ORDER_INFO = '/redtea/rsp2/es2plus/order/info'
+EP_PROFILE_INFO = '/redtea/rsp2/es2plus/profile/info'
+EP_PROFILE_TYPE_INFO = '/redtea/rsp2/es2plus/profileType/info'
+EP_PROFILE_TYPE_LIST = '/redtea/rsp2/es2plus/profileType/list'
+EP_GENERATE_BY_METADATA = '/redtea/rsp2/es2plus/order/generateByProfileMetadata'
+EP_BATCH_GENERATE_BY_METADATA = '/redtea/rsp2/es2plus/order/batchGenerateByProfileMetadata'
+EP_DEVICE_BLOCKLIST_LIST = '/redtea/rsp2/es2plus/device/blocklist/list'
+EP_TRANSACTION_LIST = '/redtea/rsp2/es2plus/transaction/list'
+EP_HEALTH_STATUS = '/redtea/rsp2/es2plus/health/status'
+EP_PROFILE_ADD_BY_UPP = '/redtea/rsp2/es2plus/profile/addByUpp'
+EP_PROFILE_ADD_BY_META = '/redtea/rsp2/es2plus/profile/addByMeta'
+EP_PROFILE_UPDATE_PARAM = '/redtea/rsp2/es2plus/profile/updateParam'
+EP_PROFILE_STATE_STATISTICS = '/redtea/rsp2/es2plus/profile/getProfileStateStatistics'
+EP_PROFILE_TYPE_ADD = '/redtea/rsp2/es2plus/profileType/add'
+EP_PROFILE_TYPE_UPDATE = '/redtea/rsp2/es2plus/profileType/update'
+EP_OP_ADD = '/redtea/rsp2/es2plus/mno/op/add'
+EP_OP_DELETE = '/redtea/rsp2/es2plus/mno/op/delete'
+EP_OP_LIST = '/redtea/rsp2/es2plus/mno/op/list'
+EP_DEVICE_BLOCKLIST_ADD = '/redtea/rsp2/es2plus/device/blocklist/add'
+EP_DEVICE_BLOCKLIST_DELETE = '/redtea/rsp2/es2plus/device/blocklist/delete'
+EP_CAMPAIGN_CREATE = '/redtea/rsp2/es2plus/campaign/create'
+EP_DOWNLOAD_ORDER = '/gsma/rsp2/es2plus/downloadOrder'
+EP_EXPIRE_ORDER = '/redtea/rsp2/es2plus/order/expire'
+
+# Cache HTTP opcional (requests-cache) para endpoints só de leitura
+RESPONSE_CACHE_PATH = Path(__file__).resolve().parent.parent / "configs" / "rsp_cache.sqlite"
+RESPONSE_CACHE_EXPIRE = 600  # segundos
+
+# Threads por omissão em batch_expire (abaixo do pool_maxsize do HTTPAdapter)
+BATCH_MAX_WORKERS = 32
+
 class RSPClientError(Exception):
     """Base exception for RSP client errors."""
 
 class RSPClientRequestError(RSPClientError):
-    """Raised for errors during API requests."""
+    """Raised for errors during API requests; `status` holds the HTTP status code, if any."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
 
 class RSPClientAuthenticationError(RSPClientError):
     """Raised for authentication issues."""
 
-class ESIMRSPClient:
+# Estados HTTP transitórios: só estes (e falhas de ligação/timeout) justificam nova tentativa
+RETRYABLE_STATUS = frozenset({500, 502, 503, 504})
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Return True for connect/read timeouts and 5xx responses; 4xx and auth failures are permanent."""
+    if isinstance(exc, RSPClientRequestError):
+        if exc.status is not None:
+            return exc.status in RETRYABLE_STATUS
+        exc = exc.__cause__
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_env_file(env_path: Optional[str] = None) -> None:
     """
-    A comprehensive client for interacting with the eSIM.plus Remote SIM Provisioning (RSP) platform.
+    Load RSP credentials from the .env file (configs/.env by default) into the process environment.
+    Cached per env_path: the file is read once per process, not once per client.
 
-    This client supports various operations defined in the eSIM.plus RSP Interface Manual.
+    :param env_path: Optional path to the .env file
+    """
+    if env_path:
+        env_file = Path(env_path)
+    else:
+        project_root = Path(__file__).resolve().parent.parent
+        env_file = project_root / "configs" / ".env"
+
+    if env_file.exists():
+        load_dotenv(dotenv_path=env_file)
+        logger.info(f".env carregado a partir de: {env_file}")
+    else:
+        # fallback: carregar variáveis de ambiente do processo
+        load_dotenv()  # tenta carregar do cwd se existir
+        logger.warning(f".env não encontrado em {env_file}, carregado fallback padrão (cwd).")
+
+
+@functools.lru_cache(maxsize=4)
+def _environment_config(environment: str, env_path: Optional[str] = None) -> Tuple[str, str, str]:
+    """
+    Read (and cache) the credentials of an environment from the process environment / .env file.
+
+    :param environment: 'test' or 'prod'
+    :param env_path: Optional path to the .env file
+    :return: Tuple of (access_key, secret_key, base_url)
+    :raises ValueError: If credentials for the environment are missing
+    """
+    _load_env_file(env_path)
+    prefix = environment.upper()
+    access_key = os.getenv(f"{prefix}_ACCESS_KEY")
+    secret_key = os.getenv(f"{prefix}_SECRET_KEY")
+    base_url = os.getenv(f"{prefix}_URL")
+    if not access_key or not secret_key or not base_url:
+        raise ValueError(f"Missing credentials for {environment} environment.")
+    return access_key, secret_key, base_url
+
+
+class RSPClientBase:
+    """
+    Credentials, request signing and ES2+ body construction shared by ESIMRSPClient
+    and AsyncESIMRSPClient. Holds no transport state: subclasses own the HTTP session.
     """
 
-    def __init__(self, environment: str = 'test', env_path: Optional[str] = None):
+    def __init__(self, environment: str = 'test', env_path: Optional[str] = None, retry_policy: Optional[RetryPolicy] = None):
         """
-        Initialize the RSP client with environment-specific configuration.
+        Load the environment credentials and the retry policy.
 
         Attributes:
             environment (str): 'test' or 'prod' to select the environment
             env_path (str, optional): Path to the .env file
+            retry_policy (RetryPolicy, optional): Retry policy shared with the caller;
+                loaded from configs.json when omitted
 
         Raises:
-            ValueError: If an invalid environment is provided
-            RSPClientAuthenticationError: If authentication fails
-            RSPClientRequestError: For other request-related errors
-
-        Returns:
-            None
+            ValueError: If credentials for the environment are missing
         """
-
-        # Carregar .env a partir de configs/.env por omissão
-        if env_path:
-            env_file = Path(env_path)
-        else:
-            project_root = Path(__file__).resolve().parent.parent
-            env_file = project_root / "configs" / ".env"
-
-        if env_file.exists():
-            load_dotenv(dotenv_path=env_file)
-            logger.info(f".env carregado a partir de: {env_file}")
-        else:
-            # fallback: carregar variáveis de ambiente do processo
-            load_dotenv()  # tenta carregar do cwd se existir
-            logger.warning(f".env não encontrado em {env_file}, carregado fallback padrão (cwd).")
-
         self.environment = environment
-        # obtém credenciais (p.ex. TEST_ACCESS_KEY, TEST_SECRET_KEY, TEST_URL)
+        self._env_path = env_path
+        # obtém credenciais (p.ex. TEST_ACCESS_KEY, TEST_SECRET_KEY, TEST_URL); configs/.env é lido uma vez por processo
         self.access_key, self.secret_key, self.base_url = self._get_environment_config()
-
-        # configurar política de retry local (valores por defeito)
-        # preferível injetar esta policy de configs.json via rules_from_config
-        from core.business_rules import get_default_rules
-        _, retry_policy = get_default_rules()  # retorna (EsimRange, RetryPolicy)
+        # chave secreta em bytes: usada em cada assinatura, codificada uma única vez
+        self._secret_key_b = self.secret_key.encode()
+        # cabeçalhos fixos por instância (entram no PreparedRequest / na ClientSession); _prepare_headers só gera os assinados
+        self._header_template = {"Content-Type": "application/json", "Access-Key": self.access_key, "Sign-Method": "SHA256"}
+
+        # buffer de aleatoriedade para identificadores de pedido (um syscall por 256 ids)
+        self._rand_buf = os.urandom(4096)
+        self._rand_pos = 0
+        self._rand_lock = threading.Lock()
+
+        # política de retry: injetada pelo chamador (ex.: orquestrador) ou carregada de configs.json
+        if retry_policy is None:
+            from core.business_rules import get_default_rules
+            _, retry_policy = get_default_rules()  # retorna (EsimRange, RetryPolicy)
         self.retry_policy = retry_policy
 
     def _get_environment_config(self) -> tuple:
         """
         Retrieve environment-specific configuration.
 
+        Loads configs/.env (or env_path) on first use; cached per (environment, env_path).
+
         :return: Tuple of (access_key, secret_key, base_url)
         :raises ValueError: If an invalid environment is provided
         """
-        access_key = os.getenv(f"{self.environment.upper()}_ACCESS_KEY")
-        secret_key = os.getenv(f"{self.environment.upper()}_SECRET_KEY")
-        base_url = os.getenv(f"{self.environment.upper()}_URL")
-        if not access_key or not secret_key or not base_url:
-            raise ValueError(f"Missing credentials for {self.environment} environment.")
-        return access_key, secret_key, base_url
+        return _environment_config(self.environment, self._env_path)
+
+    def _next_uuid(self) -> str:
+        """
+        Return a random UUID4 as 32 hex chars, served from a pre-read os.urandom buffer.
+
+        :return: Hex string with RFC 4122 version/variant bits set
+        """
+        with self._rand_lock:
+            if self._rand_pos + 16 > len(self._rand_buf):
+                self._rand_buf = os.urandom(4096)
+                self._rand_pos = 0
+            b = bytearray(self._rand_buf[self._rand_pos:self._rand_pos + 16])
+            self._rand_pos += 16
+        b[6] = (b[6] & 0x0F) | 0x40  # versão 4
+        b[8] = (b[8] & 0x3F) | 0x80  # variante RFC 4122
+        return b.hex()
 
-    def _prepare_headers(self, body: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    def _prepare_headers(self, body: Optional[Dict[str, Any]] = None) -> Tuple[Tuple[Tuple[str, str], ...], bytes]:
         """
-        Prepare headers for API request with signature.
+        Prepare the per-request signed headers (Request-ID, Timestamp, Signature).
+
+        The body is serialized once; the same bytes are signed and sent on the wire. The fixed
+        headers (self._header_template) are already part of the prepared request / session, so
+        only the changing ones are returned, as (name, value) pairs.
 
         :param body: Request body
-        :return: Dictionary of headers
+        :return: Tuple (signed header pairs, body_bytes)
         """
-        request_id = str(uuid.uuid4())
-        timestamp = str(int(time.time() * 1000))
+        request_id = self._next_uuid()
+        timestamp = str(time.time_ns() // 1_000_000)
 
-        body_raw = json.dumps(body) if body else ""
-        data_str = f"{timestamp}{request_id}{body_raw}{self.secret_key}"
-        signature = hashlib.sha256(data_str.encode()).hexdigest()
+        body_bytes = orjson.dumps(body) if body else b""
+        h = hashlib.sha256()
+        h.update(timestamp.encode())
+        h.update(request_id.encode())
+        h.update(body_bytes)
+        h.update(self._secret_key_b)
+        signature = binascii.hexlify(h.digest()).decode('ascii')
 
-        return {
-            "Content-Type": "application/json",
-            "Access-Key": self.access_key,
-            "Request-ID": request_id,
-            "Timestamp": timestamp,
-            "Sign-Method": "SHA256",
-            "Signature": signature
+        return (("Request-ID", request_id), ("Timestamp", timestamp), ("Signature", signature)), body_bytes
+
+    def _body(self, fn_call_id: str, fields: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Build a request body with the standard ES2+ header.
+
+        :param fn_call_id: Value for header.functionCallIdentifier
+        :param fields: Body fields (not modified; the header is added after them)
+        :return: Request body dictionary
+        """
+        header = {
+            "functionRequesterIdentifier": self._next_uuid(),
+            "functionCallIdentifier": fn_call_id
         }
+        return {**fields, "header": header} if fields else {"header": header}
+
+
+class ESIMRSPClient(RSPClientBase):
+    """
+    A comprehensive client for interacting with the eSIM.plus Remote SIM Provisioning (RSP) platform.
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, max=10))
-    def _make_request(self, endpoint: str, method: str = 'POST', body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    This client supports various operations defined in the eSIM.plus RSP Interface Manual.
+    """
+
+    def __init__(self, environment: str = 'test', env_path: Optional[str] = None, retry_policy: Optional[RetryPolicy] = None,
+                 enable_cache: bool = False, batch_workers: int = BATCH_MAX_WORKERS):
+        """
+        Initialize the RSP client with environment-specific configuration.
+
+        Attributes:
+            environment (str): 'test' or 'prod' to select the environment
+            env_path (str, optional): Path to the .env file
+            retry_policy (RetryPolicy, optional): Retry policy shared with the caller;
+                loaded from configs.json when omitted
+            enable_cache (bool): Cache responses of read-only endpoints in a local SQLite
+                file (requires requests-cache); honours Cache-Control/ETag from the server
+            batch_workers (int): Threads of the batch_expire pool
+
+        Raises:
+            ValueError: If an invalid environment is provided
+            RSPClientAuthenticationError: If authentication fails
+            RSPClientRequestError: For other request-related errors
+
+        Returns:
+            None
+        """
+
+        super().__init__(environment, env_path, retry_policy)
+
+        # sessão HTTP com pool de ligações keep-alive (evita novo handshake TCP/TLS por pedido)
+        self._enable_cache = enable_cache
+        # kwargs que excluem um pedido da cache (vazio sem cache); resolvido uma vez aqui
+        self._no_cache_kwargs: Dict[str, Any] = {}
+        if enable_cache:
+            from requests_cache import CachedSession, DO_NOT_CACHE
+            self._no_cache_kwargs = {"expire_after": DO_NOT_CACHE}
+            self._session = CachedSession(
+                str(RESPONSE_CACHE_PATH),
+                backend="sqlite",
+                cache_control=True,
+                expire_after=RESPONSE_CACHE_EXPIRE,
+                allowable_methods=("GET", "POST"),
+                match_headers=["Access-Key"],
+                # o header ES2+ leva um functionRequesterIdentifier aleatório por pedido
+                ignored_parameters=["header"]
+            )
+        else:
+            self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=0)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # pedidos pré-preparados por endpoint (URL, headers fixos); ver _prepared_template
+        self._prepared: Dict[Tuple[str, str], Tuple[requests.PreparedRequest, Dict[str, Any]]] = {}
+
+        # pool de threads para batch_expire (as threads só arrancam no primeiro submit)
+        self._pool = ThreadPoolExecutor(max_workers=batch_workers, thread_name_prefix="rsp-expire")
+
+    def close(self) -> None:
+        """Close the underlying HTTP session, its pooled connections and the batch worker pool."""
+        self._pool.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    @retry(
+        retry=retry_if_exception(_is_transient),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, max=5) + wait_random(0, 0.5),
+        reraise=True
+    )
+    def _retrying_request(self, endpoint: str, method: str = 'POST', body: Optional[Dict[str, Any]] = None,
+                          _cacheable: bool = False) -> Dict[str, Any]:
+        """
+        Make a request to the RSP platform, retrying only transient failures
+        (connection errors, timeouts and 5xx responses; see _make_request).
+
+        :param endpoint: API endpoint
+        :param method: HTTP method (default: POST)
+        :param body: Request body
+        :param _cacheable: Whether the response may be served from / stored in the response cache
+        :return: Response JSON
         """
-        Make a generic request to the RSP platform.
+        return self._make_request(endpoint, method=method, body=body, _cacheable=_cacheable)
+
+    def _make_request(self, endpoint: str, method: str = 'POST', body: Optional[Dict[str, Any]] = None,
+                      _cacheable: bool = False) -> Dict[str, Any]:
+        """
+        Send a single signed request to the RSP platform (no retries).
 
         :param endpoint: API endpoint
         :param method: HTTP method (default: POST)
         :param body: Request body
+        :param _cacheable: Whether the response may be served from / stored in the response cache
         :return: Response JSON
+        :raises RSPClientAuthenticationError: On HTTP 401/403
+        :raises RSPClientRequestError: On any other failure (status set for HTTP errors)
         """
         full_url = f"{self.base_url}{endpoint}"
-        headers = self._prepare_headers(body)
+        signed_headers, body_bytes = self._prepare_headers(body)
+
+        kwargs = {} if _cacheable else self._no_cache_kwargs
+
+        prepared, send_kwargs = self._prepared_template(method, full_url)
+        prepared = prepared.copy()
+        prepared.headers.update(signed_headers)
+        # cookies da sessão a cada pedido (Set-Cookie recebidos depois de criado o template, ex.: afinidade do LB)
+        prepared.headers.pop("Cookie", None)
+        prepared.prepare_cookies(self._session.cookies)
+        prepared.body = body_bytes
+        prepared.prepare_content_length(body_bytes)
 
         try:
             logger.info(f"Making {method} request to {full_url}")
-            response = requests.request(method, full_url, headers=headers, json=body, timeout=10)
+            response = self._session.send(prepared, timeout=10, **send_kwargs, **kwargs)
             response.raise_for_status()
             logger.info(f"Request succeeded: {response.status_code}")
-            return response.json()
-        except requests.RequestException as e:
-            error_message = f"API request failed: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                error_message += f" | Response: {e.response.text}"
-            logger.error(error_message)
-            raise RSPClientRequestError(error_message)
+            return orjson.loads(response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            raise self._request_error(e) from e
+
+    def _prepared_template(self, method: str, url: str) -> Tuple[requests.PreparedRequest, Dict[str, Any]]:
+        """
+        Return the PreparedRequest template (URL, session headers, fixed headers) and the
+        environment send settings for an endpoint, built once per (method, url).
+        Session headers, auth and proxies are captured when the template is built and must
+        not be changed afterwards; cookies are re-applied by _make_request on every call.
+
+        :param method: HTTP method
+        :param url: Full endpoint URL
+        :return: Tuple (prepared request template, keyword arguments for Session.send)
+        """
+        key = (method, url)
+        template = self._prepared.get(key)
+        if template is None:
+            prepared = self._session.prepare_request(requests.Request(method, url, headers=self._header_template))
+            settings = self._session.merge_environment_settings(url, {}, None, None, None)
+            template = self._prepared[key] = (prepared, settings)
+        return template
+
+    def _make_request_streaming(self, endpoint: str, body: Dict[str, Any], item_path: str) -> Iterator[Any]:
+        """
+        Send a single signed request and decode the response incrementally (requires ijson),
+        yielding only the items under `item_path` instead of materializing the whole payload.
+
+        :param endpoint: API endpoint
+        :param body: Request body
+        :param item_path: ijson prefix of the items to yield (e.g. "data.item")
+        :return: Iterator over the decoded items
+        :raises RSPClientAuthenticationError: On HTTP 401/403
+        :raises RSPClientRequestError: On any other failure (status set for HTTP errors)
+        """
+        import ijson
+
+        full_url = f"{self.base_url}{endpoint}"
+        signed_headers, body_bytes = self._prepare_headers(body)
+        headers = self._header_template | dict(signed_headers)
+
+        kwargs = self._no_cache_kwargs
+
+        try:
+            logger.info(f"Making streaming POST request to {full_url}")
+            with self._session.post(full_url, headers=headers, data=body_bytes, timeout=10, stream=True, **kwargs) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, item_path, use_float=True)
+        except (requests.RequestException, ijson.JSONError) as e:
+            raise self._request_error(e) from e
+
+    @staticmethod
+    def _request_error(e: Exception) -> RSPClientError:
+        """
+        Map a failed request to the client's exception hierarchy (and log it).
+
+        :param e: Exception raised by requests or by the JSON decoder
+        :return: RSPClientAuthenticationError for 401/403, RSPClientRequestError otherwise
+        """
+        response = getattr(e, 'response', None)
+        error_message = f"API request failed: {str(e)}"
+        if response is not None:
+            error_message += f" | Response: {response.text}"
+        logger.error(error_message)
+
+        if isinstance(e, requests.HTTPError):
+            if response.status_code in (401, 403):
+                return RSPClientAuthenticationError(error_message)
+            return RSPClientRequestError(error_message, status=response.status_code)
+        return RSPClientRequestError(error_message)
 
     def get_order_info(self, iccid: str, eid: str = None, matchingId: str = None) -> Dict[str, Any]:
         """
@@ -143,17 +433,7 @@ class ESIMRSPClient:
         :param matchingId: Matching ID of the order
         :return: Order information
         """
-        endpoint = '/redtea/rsp2/es2plus/order/info'
-        body = {
-            "iccid": iccid,
-            "eid": eid,
-            "matchingId": matchingId,
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "getOrderInfo"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_ORDER_INFO, body=self._body("getOrderInfo", {"iccid": iccid, "eid": eid, "matchingId": matchingId}))
 
     def get_profile_info(self, iccid: str) -> Dict[str, Any]:
         """
@@ -162,15 +442,7 @@ class ESIMRSPClient:
         :param iccid: ICCID of the profile
         :return: Profile information
         """
-        endpoint = '/redtea/rsp2/es2plus/profile/info'
-        body = {
-            "iccid": iccid,
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "profileInfo"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_INFO, body=self._body("profileInfo", {"iccid": iccid}))
 
     def get_profile_type_info(self, profile_type_name: str) -> Dict[str, Any]:
         """
@@ -179,15 +451,8 @@ class ESIMRSPClient:
         :param profile_type_name: Name of the profile type
         :return: Profile type information
         """
-        endpoint = '/redtea/rsp2/es2plus/profileType/info'
-        body = {
-            "profileTypeName": profile_type_name,
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "getProfileTypeInfo"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_TYPE_INFO, body=self._body("getProfileTypeInfo", {"profileTypeName": profile_type_name}),
+                                      _cacheable=True)
 
     def list_profile_types(self) -> Dict[str, Any]:
         """
@@ -195,14 +460,8 @@ class ESIMRSPClient:
 
         :return: List of profile types
         """
-        endpoint = '/redtea/rsp2/es2plus/profileType/list'
-        body = {
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "listProfileType"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_TYPE_LIST, body=self._body("listProfileType"),
+                                      _cacheable=True)
 
     def generate_by_profile_metadata(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -211,24 +470,16 @@ class ESIMRSPClient:
         :param profile_data: Profile metadata dictionary
         :return: Profile generation response
         """
-        endpoint = '/redtea/rsp2/es2plus/order/generateByProfileMetadata'
-
         # Ensure required fields are present
         required_fields = ['iccid', 'imsi', 'ki', 'opc', 'encAesKey']
         for field in required_fields:
             if field not in profile_data:
                 raise ValueError(f"Missing required field: {field}")
 
-        # Prepare the full request body
-        body = {
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "generateByProfileMetadata"
-            },
-            **profile_data
-        }
+        # header first: as before, a caller-supplied header in profile_data takes precedence
+        body = {**self._body("generateByProfileMetadata"), **profile_data}
 
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_GENERATE_BY_METADATA, body=body)
 
     def batch_generate_by_profile_metadata(self, profiles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -237,17 +488,7 @@ class ESIMRSPClient:
         :param profiles: List of profile metadata dictionaries
         :return: Batch generation response
         """
-        endpoint = '/redtea/rsp2/es2plus/order/batchGenerateByProfileMetadata'
-
-        body = {
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "batchGenerateByProfileMetadata"
-            },
-            "metadatas": profiles
-        }
-
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_BATCH_GENERATE_BY_METADATA, body=self._body("batchGenerateByProfileMetadata", {"metadatas": profiles}))
 
     def list_device_blocklist(self, page_num: int = 1, page_size: int = 20, block_type: int = 0) -> Dict[str, Any]:
         """
@@ -258,38 +499,21 @@ class ESIMRSPClient:
         :param block_type: Blocking type (0: by EID, 1: by TAC)
         :return: List of blocked devices
         """
-        endpoint = '/redtea/rsp2/es2plus/device/blocklist/list'
-        body = {
-            "pageParam": {
-                "pageNum": page_num,
-                "pageSize": page_size
-            },
-            "blockType": block_type,
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "listDeviceBlocklist"
-            }
-        }
+        return self._retrying_request(EP_DEVICE_BLOCKLIST_LIST, body=self._body("listDeviceBlocklist", {"pageParam": {"pageNum": page_num, "pageSize": page_size}, "blockType": block_type}),
+                                      _cacheable=True)
 
-        return self._make_request(endpoint, body=body)
-
-    def get_transaction_list(self, iccid: str) -> Dict[str, Any]:
+    def iter_device_blocklist(self, item_path: str, page_num: int = 1, page_size: int = 20, block_type: int = 0) -> Iterator[Any]:
         """
-        Retrieve transaction logs for a specific ICCID.
+        Stream the blocked devices of one page without decoding the whole response.
 
-        :param iccid: ICCID of the profile
-        :return: List of transaction logs
+        :param item_path: ijson prefix of the list items in the response
+        :param page_num: Page number
+        :param page_size: Number of results per page
+        :param block_type: Blocking type (0: by EID, 1: by TAC)
+        :return: Iterator over blocked devices
         """
-        endpoint = '/redtea/rsp2/es2plus/transaction/list'
-        body = {
-            "iccid": iccid,
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "listTransaction"
-            }
-        }
-
-        return self._make_request(endpoint, body=body)
+        body = self._body("listDeviceBlocklist", {"pageParam": {"pageNum": page_num, "pageSize": page_size}, "blockType": block_type})
+        return self._make_request_streaming(EP_DEVICE_BLOCKLIST_LIST, body, item_path)
 
     def get_health_check_status(self) -> Dict[str, Any]:
         """
@@ -297,16 +521,8 @@ class ESIMRSPClient:
 
         :return: Service health status
         """
-        endpoint = '/redtea/rsp2/es2plus/health/status'
-
-        body = {
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "healthCheck"
-            }
-        }
-
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_HEALTH_STATUS, body=self._body("healthCheck"),
+                                      _cacheable=True)
 
     def add_profile1(self, iccid: str, imsi: str, enc_aes_key: str, enc_upp: str, profile_type: str = "") -> Dict[str, Any]:
         """
@@ -319,199 +535,93 @@ class ESIMRSPClient:
         :param profile_type: Optional profile type
         :return: Response from the API
         """
-        endpoint = '/redtea/rsp2/es2plus/profile/addByUpp'
-        body = {
-            "iccid": iccid,  # Unique identifier for the SIM
-            "imsi": imsi,  # International Mobile Subscriber Identity
-            "encAesKey": enc_aes_key,  # Encrypted AES key
-            "encUpp": enc_upp,  # Encrypted UPP parameters
-            "profileType": profile_type,  # Optional profile type
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),  # Unique request identifier
-                "functionCallIdentifier": "addByUpp"  # Function call identifier
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_ADD_BY_UPP, body=self._body("addByUpp", {"iccid": iccid, "imsi": imsi, "encAesKey": enc_aes_key, "encUpp": enc_upp, "profileType": profile_type}))
 
     def add_profile2(self, iccid: str, imsi: str, ki: str, opc: str, enc_aes_key: str, profile_type: str = "") -> Dict[str, Any]:
         """
         Endpoint for adding a profile using metadata
         """
-        endpoint = '/redtea/rsp2/es2plus/profile/addByMeta'
-        body = {
-            "iccid": iccid,
-            "imsi": imsi,
-            "ki": ki,  # Key Identifier
-            "opc": opc,  # Operator Code
-            "encAesKey": enc_aes_key,
-            "profileType": profile_type,
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "addByMeta"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_ADD_BY_META, body=self._body("addByMeta", {"iccid": iccid, "imsi": imsi, "ki": ki, "opc": opc, "encAesKey": enc_aes_key, "profileType": profile_type}))
 
     def update_profile_param(self, iccid: str, param_key_value_list: List[Dict[str, str]], enc_aes_key: str = "") -> Dict[str, Any]:
         """
         Endpoint for updating profile parameters
         """
-        endpoint = '/redtea/rsp2/es2plus/profile/updateParam'
-        body = {
-            "iccid": iccid,
-            "paramKeyValueList": param_key_value_list,  # List of parameters to update
-            "encAesKey": enc_aes_key,  # Optional encrypted AES key
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "updateParam"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_UPDATE_PARAM, body=self._body("updateParam", {"iccid": iccid, "paramKeyValueList": param_key_value_list, "encAesKey": enc_aes_key}))
 
     def get_profile_state_statistics(self, profile_type: str = "", state: str = "") -> Dict[str, Any]:
         """
         Endpoint for retrieving profile state statistics
         """
-        endpoint = '/redtea/rsp2/es2plus/profile/getProfileStateStatistics'
-        body = {
-            "profileType": profile_type,  # Optional profile type filter
-            "state": state,  # Optional state filter
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "getProfileStateStatistics"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_STATE_STATISTICS, body=self._body("getProfileStateStatistics", {"profileType": profile_type, "state": state}))
 
     def add_profile_type(self, name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Endpoint for adding a new profile type
         """
-        endpoint = '/redtea/rsp2/es2plus/profileType/add'
-        body = {
-            "name": name,  # Name of the profile type
-            **parameters,  # Additional parameters for the profile type
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "AddProfileType"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_TYPE_ADD, body=self._body("AddProfileType", {"name": name, **parameters}))
 
     def update_profile_type(self, name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
         Endpoint for updating an existing profile type
         """
-        endpoint = '/redtea/rsp2/es2plus/profileType/update'
-        body = {
-            "name": name,  # Name of the profile type
-            **parameters,  # Parameters to update
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "UpdateProfileType"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_PROFILE_TYPE_UPDATE, body=self._body("UpdateProfileType", {"name": name, **parameters}))
 
     def add_op(self, name: str, op_type: str, enc_op: str) -> Dict[str, Any]:
         """
         Endpoint for adding a new Operator Code (OP)
         """
-        endpoint = '/redtea/rsp2/es2plus/mno/op/add'
-        body = {
-            "name": name,  # Name of the OP
-            "type": op_type,  # Type of the OP
-            "encOP": enc_op,  # Encrypted Operator Code
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "AddOP"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_OP_ADD, body=self._body("AddOP", {"name": name, "type": op_type, "encOP": enc_op}))
 
     def delete_op(self, name: str) -> Dict[str, Any]:
         """
         Endpoint for deleting an existing Operator Code (OP)
         """
-        endpoint = '/redtea/rsp2/es2plus/mno/op/delete'
-        body = {
-            "name": name,  # Name of the OP to delete
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "DeleteOP"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_OP_DELETE, body=self._body("DeleteOP", {"name": name}))
 
     def list_op(self) -> Dict[str, Any]:
         """
         Endpoint for listing all Operator Codes (OPs)
         """
-        endpoint = '/redtea/rsp2/es2plus/mno/op/list'
-        body = {
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "ListOP"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_OP_LIST, body=self._body("ListOP"),
+                                      _cacheable=True)
 
     def add_device_to_blocklist(self, device_id: str, block_reason: str) -> Dict[str, Any]:
         """
         Endpoint for adding a device to the blocklist
         """
-        endpoint = '/redtea/rsp2/es2plus/device/blocklist/add'
-        body = {
-            "deviceId": device_id,  # Identifier for the device
-            "blockReason": block_reason,  # Reason for blocking the device
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "AddDeviceToBlocklist"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_DEVICE_BLOCKLIST_ADD, body=self._body("AddDeviceToBlocklist", {"deviceId": device_id, "blockReason": block_reason}))
 
     def delete_device_from_blocklist(self, device_id: str) -> Dict[str, Any]:
         """
         Endpoint for removing a device from the blocklist
         """
-        endpoint = '/redtea/rsp2/es2plus/device/blocklist/delete'
-        body = {
-            "deviceId": device_id,  # Identifier for the device to remove
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "DeleteDeviceFromBlocklist"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_DEVICE_BLOCKLIST_DELETE, body=self._body("DeleteDeviceFromBlocklist", {"deviceId": device_id}))
 
     def create_campaign(self, campaign_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Endpoint for creating a new campaign
         """
-        endpoint = '/redtea/rsp2/es2plus/campaign/create'
-        body = {
-            **campaign_data,  # Campaign-specific data
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "CreateCampaign"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_CAMPAIGN_CREATE, body=self._body("CreateCampaign", campaign_data))
 
     def get_transaction_list(self, iccid: str) -> Dict[str, Any]:
         """
-        Endpoint for retrieving transaction logs for a specific ICCID
+        Retrieve transaction logs for a specific ICCID.
+
+        :param iccid: ICCID of the profile
+        :return: List of transaction logs
         """
-        endpoint = '/redtea/rsp2/es2plus/transaction/list'
-        body = {
-            "iccid": iccid,  # ICCID of the SIM
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "GetTransactionList"
-            }
-        }
-        return self._make_request(endpoint, body=body)
+        return self._retrying_request(EP_TRANSACTION_LIST, body=self._body("GetTransactionList", {"iccid": iccid}))
+
+    def iter_transaction_list(self, iccid: str, item_path: str) -> Iterator[Any]:
+        """
+        Stream the transaction logs of an ICCID without decoding the whole response.
+
+        :param iccid: ICCID of the SIM
+        :param item_path: ijson prefix of the list items in the response
+        :return: Iterator over transaction logs
+        """
+        return self._make_request_streaming(EP_TRANSACTION_LIST, self._body("GetTransactionList", {"iccid": iccid}), item_path)
 
     def download_order(self, iccid: str) -> Dict[str, Any]:
         """
@@ -522,17 +632,10 @@ class ESIMRSPClient:
         :return: Response containing order information and execution status
         :raises RSPClientRequestError: If API request fails
         """
-        endpoint = '/gsma/rsp2/es2plus/downloadOrder'
-        body = {
-            "iccid": iccid,
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "downloadOrder"
-            }
-        }
+        body = self._body("downloadOrder", {"iccid": iccid})
 
         logger.info(f"[DownloadOrder] Initiating download order for ICCID={iccid}")
-        response = self._make_request(endpoint=endpoint, method='POST', body=body)
+        response = self._retrying_request(endpoint=EP_DOWNLOAD_ORDER, method='POST', body=body)
         logger.info(f"[DownloadOrder] Success for ICCID={iccid}")
 
         return response
@@ -540,7 +643,7 @@ class ESIMRSPClient:
     def expire_order(self, iccid: str, final_status: str = "Unavailable", matchingId: Optional[str] = None, eid: Optional[str] = None) -> Dict[str, Any]:
         """
         Chama o endpoint ExpireOrder para marcar o perfil como 'Unavailable' ou 'Available'.
-        Usa retry manual baseado em self.retry_policy para maior controlo e logging.
+        Cada tentativa é um único pedido HTTP; o retry é feito por tenacity conforme self.retry_policy.
 
         :param iccid: ICCID do perfil a expirar (string)
         :param final_status: 'Unavailable' (default) ou 'Available'
@@ -548,15 +651,7 @@ class ESIMRSPClient:
         :param eid: (opcional) EID do eUICC
         :return: dicionário com resultado (status, attempts, http_status, response)
         """
-        endpoint = "/redtea/rsp2/es2plus/order/expire"
-        payload = {
-            "iccid": iccid,
-            "finalProfileStatusIndicator": final_status,
-            "header": {
-                "functionRequesterIdentifier": str(uuid.uuid4()),
-                "functionCallIdentifier": "expireOrder"
-            }
-        }
+        payload = self._body("expireOrder", {"iccid": iccid, "finalProfileStatusIndicator": final_status})
         # adicionar campos condicionais se fornecidos
         if matchingId:
             payload["matchingId"] = matchingId
@@ -564,49 +659,64 @@ class ESIMRSPClient:
             payload["eid"] = eid
 
         attempts = 0
-        last_exception = None
-        start_ts = datetime.utcnow().isoformat() + "Z"
-
-        while True:
-            attempts += 1
-            try:
-                logger.info(f"[ExpireOrder] ICCID={iccid} attempt={attempts} payload={payload}")
-                # Usa o _make_request existente para juntar headers e fazer a request
-                response = self._make_request(endpoint=endpoint, method='POST', body=payload)
-                # Log estruturado do sucesso
-                result = {
-                    "iccid": iccid,
-                    "status": "success",
-                    "attempts": attempts,
-                    "http_status": 200,
-                    "response": response,
-                    "start_ts": start_ts,
-                    "end_ts": datetime.utcnow().isoformat() + "Z"
-                }
-                logger.info(f"[ExpireOrder] Success ICCID={iccid} attempts={attempts}")
-                return result
-
-            except Exception as exc:
-                last_exception = exc
-                logger.warning(f"[ExpireOrder] ICCID={iccid} attempt={attempts} failed: {exc}")
-
-                # se ainda é permitido retentar
-                if self.retry_policy.can_retry(attempts):
-                    delay = self.retry_policy.next_delay(attempts)
-                    logger.info(f"[ExpireOrder] ICCID={iccid} retrying in {delay:.1f}s (attempt {attempts+1})")
-                    time.sleep(delay)
-                    continue
-                else:
-                    # Registo final de falha e retorno com erro estruturado
-                    payload_err = {
-                        "iccid": iccid,
-                        "status": "failed",
-                        "attempts": attempts,
-                        "http_status": None,
-                        "error": str(last_exception),
-                        "start_ts": start_ts,
-                        "end_ts": datetime.utcnow().isoformat() + "Z"
-                    }
-                    logger.error(f"[ExpireOrder] ICCID={iccid} failed after {attempts} attempts: {last_exception}")
-                    # opcional: lançar exceção ou devolver payload_err — escolhe conforme política
-                    return payload_err
+        start_ts = utc_timestamp()
+
+        # retry único, conduzido pela política (_make_request faz uma só tentativa HTTP)
+        retrying = Retrying(
+            retry=retry_if_exception(_is_transient),
+            stop=stop_after_attempt(self.retry_policy.max_attempts),
+            wait=lambda retry_state: self.retry_policy.next_delay(retry_state.attempt_number),
+            before_sleep=lambda retry_state: logger.info(
+                f"[ExpireOrder] ICCID={iccid} retrying in {retry_state.next_action.sleep:.1f}s "
+                f"(attempt {retry_state.attempt_number + 1})"
+            ),
+            reraise=True
+        )
+
+        try:
+            for attempt in retrying:
+                with attempt:
+                    attempts = attempt.retry_state.attempt_number
+                    logger.info(f"[ExpireOrder] ICCID={iccid} attempt={attempts} payload={payload}")
+                    try:
+                        response = self._make_request(endpoint=EP_EXPIRE_ORDER, method='POST', body=payload)
+                    except Exception as exc:
+                        logger.warning(f"[ExpireOrder] ICCID={iccid} attempt={attempts} failed: {exc}")
+                        raise
+        except Exception as exc:
+            # Registo final de falha e retorno com erro estruturado
+            logger.error(f"[ExpireOrder] ICCID={iccid} failed after {attempts} attempts: {exc}")
+            return {
+                "iccid": iccid,
+                "status": "failed",
+                "attempts": attempts,
+                "http_status": None,
+                "error": str(exc),
+                "start_ts": start_ts,
+                "end_ts": utc_timestamp()
+            }
+
+        logger.info(f"[ExpireOrder] Success ICCID={iccid} attempts={attempts}")
+        return {
+            "iccid": iccid,
+            "status": "success",
+            "attempts": attempts,
+            "http_status": 200,
+            "response": response,
+            "start_ts": start_ts,
+            "end_ts": utc_timestamp()
+        }
+
+    def batch_expire(self, iccids: List[str], final_status: str = "Unavailable") -> List[Dict[str, Any]]:
+        """
+        Expira várias ICCIDs em paralelo no pool de threads do cliente (dimensionado por batch_workers no
+        construtor; ligações do mesmo Session pool).
+        A rede é a parte dominante de cada chamada e liberta o GIL, pelo que os pedidos ficam sobrepostos.
+
+        :param iccids: ICCIDs a expirar
+        :param final_status: 'Unavailable' (default) ou 'Available'
+        :return: lista de resultados de expire_order, pela ordem de entrada
+        :raises Exception: a primeira exceção inesperada de expire_order, relançada aqui
+        """
+        futures = [self._pool.submit(self.expire_order, iccid, final_status) for iccid in iccids]
+        return [future.result() for future in futures]
@@ -0,0 +1,260 @@
+# core/esim_rsp_client_async.py
+"""
+Async RSP client for concurrent ICCID fan-out.
+
+Provides:
+- AsyncESIMRSPClient: aiohttp-based twin of ESIMRSPClient for the hot endpoints
+  (order info, profile info, download order, expire order)
+- expire_many: expires a list of ICCIDs concurrently, overlapping network latency
+
+Usage:
+    async with AsyncESIMRSPClient(environment="prod") as client:
+        results = await client.expire_many(iccids)
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import orjson
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
+
+from core.business_rules import RetryPolicy, utc_timestamp
+from core.esim_rsp_client import (
+    EP_DOWNLOAD_ORDER, EP_EXPIRE_ORDER, EP_ORDER_INFO, EP_PROFILE_INFO, RETRYABLE_STATUS,
+    RSPClientAuthenticationError, RSPClientBase, RSPClientError, RSPClientRequestError
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """aiohttp counterpart of esim_rsp_client._is_transient: connection errors, timeouts and 5xx responses."""
+    if isinstance(exc, RSPClientRequestError):
+        if exc.status is not None:
+            return exc.status in RETRYABLE_STATUS
+        exc = exc.__cause__
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+class AsyncESIMRSPClient(RSPClientBase):
+    """
+    Asynchronous client for the eSIM.plus RSP platform, built on aiohttp.
+
+    Shares credentials loading and request signing with ESIMRSPClient (RSPClientBase); must
+    be used as an async context manager so the underlying ClientSession is opened and closed.
+    """
+
+    def __init__(self, environment: str = 'test', env_path: Optional[str] = None,
+                 retry_policy: Optional[RetryPolicy] = None, concurrency: int = 50):
+        """
+        Initialize the async RSP client.
+
+        Attributes:
+            environment (str): 'test' or 'prod' to select the environment
+            env_path (str, optional): Path to the .env file
+            retry_policy (RetryPolicy, optional): Retry policy; loaded from configs.json when omitted
+            concurrency (int): Maximum simultaneous connections to the RSP host
+                (tune to the platform rate limit)
+
+        Raises:
+            ValueError: If credentials for the environment are missing
+        """
+        super().__init__(environment, env_path, retry_policy)
+
+        self.concurrency = concurrency
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        """Async context manager entry: open the pooled ClientSession."""
+        connector = aiohttp.TCPConnector(
+            limit=self.concurrency,
+            limit_per_host=self.concurrency,
+            ttl_dns_cache=300
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self._header_template,
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying ClientSession and its pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _make_request(self, endpoint: str, method: str = 'POST', body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a generic request to the RSP platform.
+
+        :param endpoint: API endpoint
+        :param method: HTTP method (default: POST)
+        :param body: Request body
+        :return: Response JSON
+        :raises RSPClientAuthenticationError: On HTTP 401/403
+        :raises RSPClientRequestError: If the request fails or returns another HTTP error status
+        """
+        if self._session is None:
+            raise RSPClientError("AsyncESIMRSPClient must be used as 'async with AsyncESIMRSPClient(...)'")
+
+        full_url = f"{self.base_url}{endpoint}"
+        signed_headers, body_bytes = self._prepare_headers(body)
+
+        try:
+            logger.info(f"Making {method} request to {full_url}")
+            async with self._session.request(method, full_url, headers=signed_headers, data=body_bytes) as response:
+                content = await response.read()
+                if response.status >= 400:
+                    error_message = (
+                        f"API request failed: {response.status} {response.reason} | Response: {content.decode(errors='replace')}"
+                    )
+                    logger.error(error_message)
+                    if response.status in (401, 403):
+                        raise RSPClientAuthenticationError(error_message)
+                    raise RSPClientRequestError(error_message, status=response.status)
+                logger.info(f"Request succeeded: {response.status}")
+                return orjson.loads(content)
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            error_message = f"API request failed: {e!r}"
+            logger.error(error_message)
+            raise RSPClientRequestError(error_message) from e
+
+    async def _retrying_request(self, endpoint: str, method: str = 'POST', body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make a request to the RSP platform, retrying only transient failures
+        (same predicate, stop and wait as ESIMRSPClient._retrying_request).
+
+        :param endpoint: API endpoint
+        :param method: HTTP method (default: POST)
+        :param body: Request body
+        :return: Response JSON
+        """
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(_is_transient),
+            stop=stop_after_attempt(3),
+            wait=wait_exponential(multiplier=0.5, max=5) + wait_random(0, 0.5),
+            reraise=True
+        ):
+            with attempt:
+                return await self._make_request(endpoint, method=method, body=body)
+
+    async def get_order_info(self, iccid: str, eid: str = None, matchingId: str = None) -> Dict[str, Any]:
+        """
+        Retrieve information about a specific order.
+
+        :param iccid: ICCID of the order
+        :param eid: EID of the order
+        :param matchingId: Matching ID of the order
+        :return: Order information
+        """
+        return await self._retrying_request(EP_ORDER_INFO, body=self._body("getOrderInfo", {"iccid": iccid, "eid": eid, "matchingId": matchingId}))
+
+    async def get_profile_info(self, iccid: str) -> Dict[str, Any]:
+        """
+        Retrieve information about a specific profile.
+
+        :param iccid: ICCID of the profile
+        :return: Profile information
+        """
+        return await self._retrying_request(EP_PROFILE_INFO, body=self._body("profileInfo", {"iccid": iccid}))
+
+    async def download_order(self, iccid: str) -> Dict[str, Any]:
+        """
+        Download/allocate a profile order for an AVAILABLE profile.
+
+        :param iccid: ICCID of the profile to download
+        :return: Response containing order information and execution status
+        :raises RSPClientRequestError: If API request fails
+        """
+        body = self._body("downloadOrder", {"iccid": iccid})
+
+        logger.info(f"[DownloadOrder] Initiating download order for ICCID={iccid}")
+        response = await self._retrying_request(endpoint=EP_DOWNLOAD_ORDER, method='POST', body=body)
+        logger.info(f"[DownloadOrder] Success for ICCID={iccid}")
+
+        return response
+
+    async def expire_order(self, iccid: str, final_status: str = "Unavailable", matchingId: Optional[str] = None, eid: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Versão assíncrona de ESIMRSPClient.expire_order: mesmo payload e mesmo resultado estruturado,
+        com as esperas entre tentativas (tenacity.AsyncRetrying) feitas via asyncio.sleep (não bloqueia as restantes ICCIDs).
+
+        :param iccid: ICCID do perfil a expirar (string)
+        :param final_status: 'Unavailable' (default) ou 'Available'
+        :param matchingId: (opcional) matchingId do order, se disponível
+        :param eid: (opcional) EID do eUICC
+        :return: dicionário com resultado (status, attempts, http_status, response)
+        """
+        payload = self._body("expireOrder", {"iccid": iccid, "finalProfileStatusIndicator": final_status})
+        if matchingId:
+            payload["matchingId"] = matchingId
+        if eid:
+            payload["eid"] = eid
+
+        attempts = 0
+        start_ts = utc_timestamp()
+
+        retrying = AsyncRetrying(
+            retry=retry_if_exception(_is_transient),
+            stop=stop_after_attempt(self.retry_policy.max_attempts),
+            wait=lambda retry_state: self.retry_policy.next_delay(retry_state.attempt_number),
+            before_sleep=lambda retry_state: logger.info(
+                f"[ExpireOrder] ICCID={iccid} retrying in {retry_state.next_action.sleep:.1f}s "
+                f"(attempt {retry_state.attempt_number + 1})"
+            ),
+            reraise=True
+        )
+
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    attempts = attempt.retry_state.attempt_number
+                    logger.info(f"[ExpireOrder] ICCID={iccid} attempt={attempts} payload={payload}")
+                    try:
+                        response = await self._make_request(endpoint=EP_EXPIRE_ORDER, method='POST', body=payload)
+                    except Exception as exc:
+                        logger.warning(f"[ExpireOrder] ICCID={iccid} attempt={attempts} failed: {exc}")
+                        raise
+        except Exception as exc:
+            logger.error(f"[ExpireOrder] ICCID={iccid} failed after {attempts} attempts: {exc}")
+            return {
+                "iccid": iccid,
+                "status": "failed",
+                "attempts": attempts,
+                "http_status": None,
+                "error": str(exc),
+                "start_ts": start_ts,
+                "end_ts": utc_timestamp()
+            }
+
+        logger.info(f"[ExpireOrder] Success ICCID={iccid} attempts={attempts}")
+        return {
+            "iccid": iccid,
+            "status": "success",
+            "attempts": attempts,
+            "http_status": 200,
+            "response": response,
+            "start_ts": start_ts,
+            "end_ts": utc_timestamp()
+        }
+
+    async def expire_many(self, iccids: List[str], final_status: str = "Unavailable") -> List[Any]:
+        """
+        Expire several ICCIDs concurrently (bounded by `concurrency` connections).
+
+        :param iccids: ICCIDs to expire
+        :param final_status: 'Unavailable' (default) ou 'Available'
+        :return: One expire_order result per ICCID, in input order
+            (an exception object if a call raised unexpectedly)
+        """
+        return await asyncio.gather(
+            *(self.expire_order(iccid, final_status=final_status) for iccid in iccids),
+            return_exceptions=True
+        )
@@ -14,7 +14,6 @@ Complete implementation of the eSIM deactivation workflow:
 
 import fnmatch
 import os
-import sys
 import shutil
 import logging
 import time
@@ -24,11 +23,6 @@ from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
-# Add project root to path
-project_root = os.path.abspath(os.path.dirname(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 # Import project modules
 from core.esim_rsp_client import ESIMRSPClient, RSPClientError
 from core.xml_processor import XMLProcessor, NginRecord
@@ -58,6 +52,7 @@ class ProcessConfig:
     staging_dir: str = "staging"
     processed_dir: str = "processed"
     reports_dir: str = "reports"
+    report_formats: Tuple[str, ...] = ("csv",)
     ftp_root_path: str = "/SIEBEL/NGIN"
     ftp_done_folder: str = "done"
     ftp_error_folder: str = "error"
@@ -125,6 +120,7 @@ class ESIMDeactivationOrchestrator:
                 staging_dir=self.json_config.get("paths", {}).get("staging", "staging"),
                 processed_dir=self.json_config.get("paths", {}).get("processed", "processed"),
                 reports_dir=self.json_config.get("paths", {}).get("reports", "reports"),
+                report_formats=tuple(process_cfg.get("report_formats", ("csv",))),
                 ftp_root_path=self.ftp_config.get("path", "/SIEBEL/NGIN"),
                 ftp_done_folder=self.ftp_config.get("done_folder", "done"),
                 ftp_error_folder=self.ftp_config.get("error_folder", "error"),
@@ -165,7 +161,8 @@ class ESIMDeactivationOrchestrator:
             # Initialize RSP client
             self.rsp_client = ESIMRSPClient(
                 environment=self.config.environment,
-                env_path=self.config.env_path
+                env_path=self.config.env_path,
+                retry_policy=self.retry_policy
             )
 
             # Initialize XML processor
@@ -174,7 +171,8 @@ class ESIMDeactivationOrchestrator:
             # Initialize report generator
             self.report_generator = ReportGenerator(
                 report_dir=self.config.reports_dir,
-                retention_days=self.config.retention_days
+                retention_days=self.config.retention_days,
+                formats=self.config.report_formats
             )
 
             # Initialize email sender if enabled
@@ -341,155 +339,6 @@ class ESIMDeactivationOrchestrator:
 
         return deactivations
 
-    def _process_batch_old(self, batch: List[NginRecord], file_source: str) -> List[ProcessingResult]:
-        """
-        Process a batch of ICCIDs through the RSP API.
-
-        Args:
-            batch: List of records to process
-            file_source: Source file name
-
-        Returns:
-            List of processing results
-        """
-        results = []
-
-        for record in batch:
-            start_time = time.time()
-            result = ProcessingResult(
-                iccid=record.iccid,
-                imsi=record.imsi,
-                msisdn=record.msisdn,
-                file_source=file_source,
-                timestamp=datetime.now(),
-                status="PENDING",
-                retry_attempts=0
-            )
-
-            try:
-                # Retry loop
-                for attempt in range(1, self.retry_policy.max_attempts + 1):
-                    try:
-                        self.logger.info(
-                            f"Attempting to deactivate ICCID {record.iccid} "
-                            f"(attempt {attempt}/{self.retry_policy.max_attempts})"
-                        )
-
-                        response = self.rsp_client.expire_order(iccid=record.iccid)
-                        result.retry_attempts = attempt
-                        result.api_response = response
-
-                        # Extract business status from nested response structure
-                        exec_status = response.get("response", {}).get("header", {}).get("functionExecutionStatus", {})
-                        status = exec_status.get("status")
-
-                        if status == "Executed-Success":
-                            result.status = "SUCCESS"
-                            result.success_reason = "DEACTIVATED"
-                            self.logger.info(
-                                f"Successfully deactivated ICCID {record.iccid} - "
-                                f"profile marked as unavailable"
-                            )
-                            break
-
-                        elif status == "Failed":
-                            status_data = exec_status.get("statusCodeData", {})
-                            subject_code = status_data.get('subjectCode', '')
-                            reason_code = status_data.get('reasonCode', '')
-                            error_code = f"{subject_code}/{reason_code}"
-                            error_msg = status_data.get("message", "Unknown error")
-
-                            # Business case: Expire Order not Exist (8.2.1/3.3)
-                            # Interpretation: The order to expire doesn't exist because
-                            # the profile is already in an expired/unavailable state
-                            if error_code == "8.2.1/3.3":
-                                result.status = "SUCCESS"
-                                result.success_reason = "ALREADY_EXPIRED"
-                                self.logger.info(
-                                    f"ICCID {record.iccid}: Expire order not found [{error_code}] - "
-                                    f"profile already expired or unavailable (treated as success)"
-                                )
-                                break
-
-                            # Other business errors - retry
-                            else:
-                                result.error_message = f"[{error_code}] {error_msg}"
-                                self.logger.error(
-                                    f"Business error for ICCID {record.iccid}: "
-                                    f"[{error_code}] {error_msg}"
-                                )
-
-                                if attempt >= self.retry_policy.max_attempts:
-                                    result.status = "FAILED"
-                                    self.logger.error(
-                                        f"Max retries reached for ICCID {record.iccid}"
-                                    )
-                                    break
-                                else:
-                                    delay = self.retry_policy.next_delay(attempt)
-                                    self.logger.warning(
-                                        f"Retrying ICCID {record.iccid} in {delay}s..."
-                                    )
-                                    time.sleep(delay)
-
-                        else:
-                            # Status is None or unexpected value
-                            result.status = "FAILED"
-                            result.error_message = f"Unexpected API status: {status}"
-                            self.logger.error(
-                                f"Unexpected status '{status}' for ICCID {record.iccid}. "
-                                f"Response keys: {list(response.keys())}"
-                            )
-                            break
-
-                    except RSPClientError as e:
-                        result.retry_attempts = attempt
-
-                        if attempt >= self.retry_policy.max_attempts:
-                            result.status = "FAILED"
-                            result.error_message = f"RSP Client Error: {str(e)}"
-                            self.logger.error(
-                                f"Failed to expire ICCID {record.iccid} after "
-                                f"{attempt} attempts: {e}"
-                            )
-                        else:
-                            delay = self.retry_policy.next_delay(attempt)
-                            self.logger.warning(
-                                f"RSP error for ICCID {record.iccid} (attempt {attempt}), "
-                                f"retrying in {delay}s: {e}"
-                            )
-                            time.sleep(delay)
-
-            except Exception as e:
-                result.status = "FAILED"
-                result.error_message = f"Unexpected error: {str(e)}"
-                self.logger.error(
-                    f"Unexpected error processing ICCID {record.iccid}: {e}",
-                    exc_info=True
-                )
-
-            # Log final outcome
-            result.processing_time_ms = int((time.time() - start_time) * 1000)
-
-            # Enhanced logging with success reason
-            if result.status == "SUCCESS" and result.success_reason:
-                self.logger.info(
-                    f"Finished processing ICCID {record.iccid}: "
-                    f"status={result.status} ({result.success_reason}), "
-                    f"attempts={result.retry_attempts}, time={result.processing_time_ms}ms"
-                )
-            else:
-                self.logger.info(
-                    f"Finished processing ICCID {record.iccid}: "
-                    f"status={result.status}, attempts={result.retry_attempts}, "
-                    f"time={result.processing_time_ms}ms"
-                )
-            self.logger.info(f"{'='*80}")
-
-            results.append(result)
-
-        return results
-
     def _process_batch(self, batch: List[NginRecord], file_source: str) -> List[ProcessingResult]:
         """
         Process a batch of ICCIDs through the RSP API.
@@ -771,8 +620,12 @@ class ESIMDeactivationOrchestrator:
             stats = self.report_generator.calculate_stats(self.all_results, files_info)
 
             # Generate reports
-            csv_path = self.report_generator.generate_csv(self.all_results)
-            summary_csv = self.report_generator.generate_summary_csv(self.all_results)
+            formats = self.report_generator.formats
+            # agregação por (ficheiro, estado) feita uma vez: resumo CSV e tabela do email
+            groups = self.report_generator.aggregate(self.all_results)
+            csv_path = self.report_generator.generate_csv(self.all_results) if 'csv' in formats else None
+            summary_csv = self.report_generator.generate_summary_csv(self.all_results, groups=groups) if 'csv' in formats else None
+            parquet_path = self.report_generator.generate_parquet(self.all_results) if 'parquet' in formats else None
             json_path = self.report_generator.save_json_report(self.all_results, stats)
             text_summary = self.report_generator.generate_summary(stats)
 
@@ -782,9 +635,11 @@ class ESIMDeactivationOrchestrator:
             return {
                 'csv': csv_path,
                 'summary_csv': summary_csv,
+                'parquet': parquet_path,
                 'json': json_path,
                 'text_summary': text_summary,
-                'stats': stats
+                'stats': stats,
+                'groups': groups
             }
 
         except Exception as e:
@@ -807,7 +662,7 @@ class ESIMDeactivationOrchestrator:
 
         try:
             stats = reports.get('stats')
-            email_data = self.report_generator.prepare_email_data(stats, self.all_results)
+            email_data = self.report_generator.prepare_email_data(stats, self.all_results, groups=reports.get('groups'))
 
             # Add attachments only if eSIMs were found
             attachments = []
@@ -1042,6 +897,9 @@ class ESIMDeactivationOrchestrator:
                 lock.release()
                 self.logger.info("Process lock released")
 
+            # Close pooled HTTP connections to the RSP platform
+            self.rsp_client.close()
+
             # Log final status
             end_time = datetime.now()
             duration = end_time - self.start_time
@@ -6,19 +6,26 @@ Generates CSV reports, summaries, and prepares email notifications.
 """
 
 import csv
-from itertools import chain
 import json
 import logging
+import os
+from operator import itemgetter
+import sys
+import orjson
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
-from collections import Counter
+
+try:  # polars é opcional: escrita colunar de CSV; sem ele usa-se o módulo csv
+    import polars as pl
+except ImportError:
+    pl = None
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Data class for individual ICCID processing results."""
     iccid: str
@@ -35,10 +42,55 @@ class ProcessingResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for CSV/JSON export."""
-        data = asdict(self)
-        data['timestamp'] = self.timestamp.strftime('%Y-%m-%d %H:%M:%S') if self.timestamp else ''
-        data['api_response'] = json.dumps(self.api_response) if self.api_response else None
-        return data
+        # mesma linha do CSV detalhado: formatação dos campos definida só em _csv_row
+        return dict(zip(CSV_FIELDS, _csv_row(self)))
+
+# Colunas do CSV detalhado (mesma ordem dos campos de ProcessingResult)
+CSV_FIELDS = ('iccid', 'imsi', 'msisdn', 'file_source', 'timestamp', 'status', 'api_response',
+              'error_message', 'success_reason', 'retry_attempts', 'processing_time_ms')
+
+# Índice de cada estado na lista de contagens de calculate_stats
+STATUS_CODES = {'SUCCESS': 0, 'FAILED': 1, 'INVALID': 2, 'SKIPPED': 3, 'OUT_OF_RANGE': 4}
+
+# Número máximo de falhas de exemplo no email
+FAILED_SAMPLE_SIZE = 10
+
+# Buffer de escrita dos CSV (1 MiB): menos chamadas write() em relatórios grandes
+CSV_WRITE_BUFFER = 1 << 20
+
+# Número de ICCIDs de exemplo por grupo no resumo CSV
+SUMMARY_SAMPLE_SIZE = 5
+
+# Cabeçalho usado quando não há resultados
+CSV_EMPTY_FIELDS = ('iccid', 'imsi', 'msisdn', 'status', 'success_reason', 'error_message',
+                    'retry_attempts', 'processing_time_ms', 'file_source', 'timestamp')
+
+# Formatos suportados para o relatório detalhado (ver ReportGenerator.formats)
+REPORT_FORMATS = ('csv', 'parquet')
+
+# Extensões apagadas por cleanup_old_reports
+REPORT_SUFFIXES = ('.csv', '.json', '.parquet')
+
+# Cabeçalho e rodapé do resumo de texto (montados uma vez; ver generate_summary)
+_SUMMARY_BANNER = "\n".join((
+    "    ╔" + "═" * 62 + "╗",
+    "    ║           eSIM DEACTIVATION PROCESS - SUMMARY               ║",
+    "    ╚" + "═" * 62 + "╝",
+))
+_SUMMARY_FOOTER = "    " + "═" * 63 + "\n    "
+
+# Colunas inteiras do CSV detalhado (restantes são texto); usado no schema polars
+CSV_INT_FIELDS = frozenset({'retry_attempts', 'processing_time_ms'})
+
+
+def _csv_row(r: ProcessingResult) -> Tuple[Any, ...]:
+    """Linha do CSV detalhado na ordem de CSV_FIELDS (base de ProcessingResult.to_dict)."""
+    return (r.iccid, r.imsi, r.msisdn, r.file_source,
+            r.timestamp.strftime('%Y-%m-%d %H:%M:%S') if r.timestamp else '',
+            r.status,
+            json.dumps(r.api_response) if r.api_response else None,
+            r.error_message, r.success_reason, r.retry_attempts, r.processing_time_ms)
+
 
 @dataclass
 class ProcessingStats:
@@ -93,20 +145,26 @@ class ReportGenerator:
     Generates various report formats for the eSIM deactivation process.
     """
 
-    def __init__(self, report_dir: str = "reports", retention_days: int = 30):
+    def __init__(self, report_dir: str = "reports", retention_days: int = 30,
+                 formats: Tuple[str, ...] = ('csv',)):
         """
         Initialize the Report Generator.
 
         Args:
             report_dir: Directory where reports will be saved
             retention_days: Number of days to retain old reports
+            formats: Detailed report formats to produce (subset of REPORT_FORMATS)
         """
+        unknown = set(formats) - set(REPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unsupported report formats: {', '.join(sorted(unknown))}")
+        self.formats = tuple(formats)
         self.report_dir = Path(report_dir)
         self.report_dir.mkdir(parents=True, exist_ok=True)
         self.retention_days = retention_days
         self.current_date = datetime.now()
 
-        logger.info(f"ReportGenerator initialized with dir: {self.report_dir}")
+        logger.info(f"ReportGenerator initialized with dir: {self.report_dir} (formats: {', '.join(self.formats)})")
 
     def generate_csv(self,
                 results: List[ProcessingResult],
@@ -127,27 +185,20 @@ class ReportGenerator:
         csv_path = self.report_dir / filename
 
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                if not results:
-                    # Write empty file with headers only
-                    fieldnames = ['iccid', 'imsi', 'msisdn', 'status', 'success_reason',
-                                'error_message', 'retry_attempts', 'processing_time_ms',
-                                'file_source', 'timestamp']
-                else:
-                    # Get all unique fields from results
-                    fieldnames = list(results[0].to_dict().keys())
-
-                    # Ensure success_reason is in fieldnames if not already present
-                    if 'success_reason' not in fieldnames and 'status' in fieldnames:
-                        # Insert success_reason right after status
-                        status_idx = fieldnames.index('status')
-                        fieldnames.insert(status_idx + 1, 'success_reason')
-
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for result in results:
-                    writer.writerow(result.to_dict())
+            if results and pl is not None:
+                # colunas construídas numa só passagem; polars serializa tudo de uma vez
+                columns = zip(*map(_csv_row, results))
+                self._write_frame(dict(zip(CSV_FIELDS, map(list, columns))), csv_path,
+                                  {f: pl.Int64 if f in CSV_INT_FIELDS else pl.Utf8 for f in CSV_FIELDS})
+            else:
+                with open(csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as csvfile:
+                    writer = csv.writer(csvfile)
+                    if not results:
+                        # Write empty file with headers only
+                        writer.writerow(CSV_EMPTY_FIELDS)
+                    else:
+                        writer.writerow(CSV_FIELDS)
+                        writer.writerows(map(_csv_row, results))
 
             logger.info(f"CSV report generated: {csv_path}")
             return str(csv_path)
@@ -156,55 +207,138 @@ class ReportGenerator:
             logger.error(f"Failed to generate CSV report: {e}")
             raise
 
-    def generate_summary_table(self, results: List[ProcessingResult]) -> List[Dict[str, Any]]:
+    def generate_parquet(self,
+                results: List[ProcessingResult],
+                filename: Optional[str] = None) -> str:
         """
-        Generate summary data for email table.
+        Generate the detailed report as a zstd-compressed Parquet file.
+
+        Same columns as generate_csv, but timestamps and counters keep their types.
+        Requires pyarrow.
 
         Args:
             results: List of processing results
+            filename: Optional custom filename
 
         Returns:
-            List of dictionaries with summary data in Portuguese
+            Path to the generated Parquet file
+        """
+        import pyarrow as pa  # opcional; só necessário quando 'parquet' está em formats
+        import pyarrow.parquet as pq
+
+        if not filename:
+            filename = f"desativacao_esim_{self.current_date:%Y%m%d_%H%M%S}.parquet"
+
+        parquet_path = self.report_dir / filename
+
+        schema = pa.schema([
+            (field, pa.timestamp('us') if field == 'timestamp'
+                    else pa.int64() if field in CSV_INT_FIELDS
+                    else pa.string())
+            for field in CSV_FIELDS
+        ])
+
+        try:
+            # colunas construídas numa só passagem (timestamp fica como datetime)
+            columns = zip(*(
+                (r.iccid, r.imsi, r.msisdn, r.file_source, r.timestamp, r.status,
+                 json.dumps(r.api_response) if r.api_response else None,
+                 r.error_message, r.success_reason, r.retry_attempts, r.processing_time_ms)
+                for r in results
+            ))
+            arrays = list(map(list, columns)) or [[] for _ in CSV_FIELDS]
+            table = pa.table(dict(zip(CSV_FIELDS, arrays)), schema=schema)
+            pq.write_table(table, parquet_path, compression='zstd')
+
+            logger.info(f"Parquet report generated: {parquet_path}")
+            return str(parquet_path)
+
+        except Exception as e:
+            logger.error(f"Failed to generate Parquet report: {e}")
+            raise
+
+    @staticmethod
+    def _write_frame(columns: Dict[str, List[Any]], csv_path: Path, schema: Dict[str, Any]) -> None:
+        """
+        Write column lists to CSV through polars (only called when polars is installed).
+
+        Uses CRLF line endings so the output matches the csv module fallback.
+
+        Args:
+            columns: Column name -> list of values, in output order
+            csv_path: Destination file
+            schema: Column name -> polars dtype
+        """
+        pl.DataFrame(columns, schema=schema).write_csv(csv_path, line_terminator='\r\n')
+
+    @staticmethod
+    def aggregate(results: List[ProcessingResult]) -> Dict[Tuple[str, str], Dict[str, Any]]:
         """
-        summary_data = {}
+        Group results by (file_source, status) in a single pass.
+
+        Used by generate_summary_table, generate_summary_csv and prepare_email_data; callers
+        producing several of these for the same results can aggregate once and pass `groups`.
+
+        Args:
+            results: List of processing results
 
+        Returns:
+            Dict keyed by (file_source, status) with 'count', 'time_sum' (ms) and
+            'iccids' (first SUMMARY_SAMPLE_SIZE ICCIDs), in first-seen order
+        """
+        groups: Dict[Tuple[str, str], Dict[str, Any]] = {}
         for result in results:
             key = (result.file_source, result.status)
-            if key not in summary_data:
-                summary_data[key] = {
-                    'Ficheiro': result.file_source,
-                    'Estado': result.status,
-                    'Quantidade': 0,
-                    'Tempo': []
-                }
-            summary_data[key]['Quantidade'] += 1
-            summary_data[key]['Tempo'].append(result.processing_time_ms or 0)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = {'count': 0, 'time_sum': 0, 'iccids': []}
+            group['count'] += 1
+            group['time_sum'] += result.processing_time_ms or 0
+            if len(group['iccids']) < SUMMARY_SAMPLE_SIZE:
+                group['iccids'].append(result.iccid)
+        return groups
+
+    def generate_summary_table(self, results: List[ProcessingResult],
+                               groups: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Generate summary data for email table.
+
+        Args:
+            results: List of processing results
+            groups: Optional result of aggregate(results), to avoid aggregating again
 
+        Returns:
+            List of dictionaries with summary data in Portuguese
+        """
         # Calculate average processing time and format output
         table_data = []
-        for data in summary_data.values():
-            avg_time_ms = sum(data['Tempo']) / len(data['Tempo']) if data['Tempo'] else 0
+        if groups is None:
+            groups = self.aggregate(results)
+        for (file_source, status), group in groups.items():
+            avg_time_ms = group['time_sum'] / group['count']
             table_data.append({
-                'Ficheiro': data['Ficheiro'],
-                'Estado': data['Estado'],
-                'Quantidade': data['Quantidade'],
+                'Ficheiro': file_source,
+                'Estado': status,
+                'Quantidade': group['count'],
                 'Tempo Médio': self._format_time(avg_time_ms)
             })
 
         # Sort by file and status
-        table_data.sort(key=lambda x: (x['Ficheiro'], x['Estado']))
+        table_data.sort(key=itemgetter('Ficheiro', 'Estado'))
 
         return table_data
 
     def generate_summary_csv(self,
                             results: List[ProcessingResult],
-                            filename: Optional[str] = None) -> str:
+                            filename: Optional[str] = None,
+                            groups: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None) -> str:
         """
         Generate a summary CSV with aggregated statistics by status.
 
         Args:
             results: List of processing results
             filename: Optional custom filename
+            groups: Optional result of aggregate(results), to avoid aggregating again
 
         Returns:
             Path to the generated summary CSV file
@@ -215,33 +349,30 @@ class ReportGenerator:
         csv_path = self.report_dir / filename
 
         # Aggregate by status and file
-        summary_data = {}
-        for result in results:
-            key = (result.file_source, result.status)
-            if key not in summary_data:
-                summary_data[key] = {
-                    'file': result.file_source,
-                    'status': result.status,
-                    'count': 0,
-                    'iccids': []
-                }
-            summary_data[key]['count'] += 1
-            summary_data[key]['iccids'].append(result.iccid)
+        summary_data = groups if groups is not None else self.aggregate(results)
 
         try:
-            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['file', 'status', 'count', 'sample_iccids']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for data in summary_data.values():
-                    row = {
-                        'file': data['file'],
-                        'status': data['status'],
-                        'count': data['count'],
-                        'sample_iccids': ', '.join(data['iccids'][:5])  # First 5 as sample
-                    }
-                    writer.writerow(row)
+            if pl is not None:
+                self._write_frame({
+                    'file': [file_source for file_source, _ in summary_data],
+                    'status': [status for _, status in summary_data],
+                    'count': [group['count'] for group in summary_data.values()],
+                    'sample_iccids': [', '.join(group['iccids']) for group in summary_data.values()],
+                }, csv_path, {'file': pl.Utf8, 'status': pl.Utf8, 'count': pl.Int64, 'sample_iccids': pl.Utf8})
+            else:
+                with open(csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER) as csvfile:
+                    fieldnames = ['file', 'status', 'count', 'sample_iccids']
+                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                    writer.writeheader()
+
+                    for (file_source, status), group in summary_data.items():
+                        row = {
+                            'file': file_source,
+                            'status': status,
+                            'count': group['count'],
+                            'sample_iccids': ', '.join(group['iccids'])  # First 5 as sample
+                        }
+                        writer.writerow(row)
 
             logger.info(f"Summary CSV generated: {csv_path}")
             return str(csv_path)
@@ -272,37 +403,53 @@ class ReportGenerator:
 
         stats.total_records = len(results)
 
-        # Count by status
-        status_counts = Counter(r.status for r in results)
-        stats.successful = status_counts.get('SUCCESS', 0)
-        stats.failed = status_counts.get('FAILED', 0)
-        stats.invalid = status_counts.get('INVALID', 0)
-        stats.skipped = status_counts.get('SKIPPED', 0)
-        stats.out_of_range = status_counts.get('OUT_OF_RANGE', 0)
-
-        # Count by success reason (breakdown of successful operations)
-        success_reason_counts = Counter(
-            r.success_reason for r in results
-            if r.status == 'SUCCESS' and r.success_reason
-        )
-        stats.deactivated = success_reason_counts.get('DEACTIVATED', 0)
-        stats.already_expired = success_reason_counts.get('ALREADY_EXPIRED', 0)
+        # Single pass: status counts, success breakdown, timing and time range
+        counts = [0] * len(STATUS_CODES)
+        status_code = STATUS_CODES.get
+        deactivated = already_expired = 0
+        time_sum = 0
+        time_count = 0
+        start_time = end_time = None
+
+        for r in results:
+            idx = status_code(r.status)
+            if idx is not None:
+                counts[idx] += 1
+                if idx == 0:  # SUCCESS
+                    if r.success_reason == 'DEACTIVATED':
+                        deactivated += 1
+                    elif r.success_reason == 'ALREADY_EXPIRED':
+                        already_expired += 1
+
+            pt = r.processing_time_ms
+            if pt > 0:
+                time_sum += pt
+                time_count += 1
+
+            ts = r.timestamp
+            if ts:
+                if start_time is None or ts < start_time:
+                    start_time = ts
+                if end_time is None or ts > end_time:
+                    end_time = ts
+
+        stats.successful, stats.failed, stats.invalid, stats.skipped, stats.out_of_range = counts
+
+        # Breakdown of successful operations
+        stats.deactivated = deactivated
+        stats.already_expired = already_expired
 
         # eSIM specific
         stats.total_esim = stats.successful + stats.failed
 
         # Timing statistics
-        if results:
-            processing_times = [r.processing_time_ms for r in results if r.processing_time_ms > 0]
-            if processing_times:
-                stats.avg_processing_time_ms = sum(processing_times) / len(processing_times)
-                stats.total_processing_time_s = sum(processing_times) / 1000
-
-            # Get time range
-            timestamps = [r.timestamp for r in results if r.timestamp]
-            if timestamps:
-                stats.start_time = min(timestamps)
-                stats.end_time = max(timestamps)
+        if time_count:
+            stats.avg_processing_time_ms = time_sum / time_count
+            stats.total_processing_time_s = time_sum / 1000
+
+        # Time range
+        stats.start_time = start_time
+        stats.end_time = end_time
 
         if stats.total_esim == 0:
             stats.is_empty_processing = True
@@ -338,50 +485,53 @@ class ReportGenerator:
                 # Different days
                 date_range = f"{stats.start_time:%Y-%m-%d %H:%M:%S} to {stats.end_time:%Y-%m-%d %H:%M:%S}"
 
-        summary = f"""
-    ╔══════════════════════════════════════════════════════════════╗
-    ║           eSIM DEACTIVATION PROCESS - SUMMARY               ║
-    ╚══════════════════════════════════════════════════════════════╝
-
-    📅 Date: {date_range}
-    ⏱️  Duration: {duration_str}
-
-    FILES PROCESSED:
-    ├─ Total Files: {stats.total_files}
-    ├─ Processed: {stats.processed_files}
-    └─ Failed: {stats.failed_files}
-
-    RECORDS SUMMARY:
-    ├─ Total Records: {stats.total_records:,}
-    ├─ Total eSIM: {stats.total_esim:,}
-    ├─ Out of Range: {stats.out_of_range:,}
-    └─ Invalid: {stats.invalid:,}
-
-    PROCESSING RESULTS:
-    ├─ ✅ Successful: {stats.successful:,} ({stats.successful/max(stats.total_esim, 1)*100:.1f}%)
-    │  ├─ Deactivated: {stats.deactivated:,}
-    │  └─ Already Expired: {stats.already_expired:,}
-    ├─ ❌ Failed: {stats.failed:,} ({stats.failed/max(stats.total_esim, 1)*100:.1f}%)
-    └─ ⏭️  Skipped: {stats.skipped:,}
-
-    PERFORMANCE:
-    ├─ Success Rate: {stats.success_rate:.1f}%
-    ├─ Avg Processing Time: {stats.avg_processing_time_ms:.0f}ms per record
-    └─ Total Processing Time: {stats.total_processing_time_s:.1f}s
-
-    ═══════════════════════════════════════════════════════════════
-    """
-        return summary
+        successful_pct = stats.successful / max(stats.total_esim, 1) * 100
+        failed_pct = stats.failed / max(stats.total_esim, 1) * 100
+
+        return "\n".join((
+            "",
+            _SUMMARY_BANNER,
+            "",
+            f"    📅 Date: {date_range}",
+            f"    ⏱️  Duration: {duration_str}",
+            "",
+            "    FILES PROCESSED:",
+            f"    ├─ Total Files: {stats.total_files}",
+            f"    ├─ Processed: {stats.processed_files}",
+            f"    └─ Failed: {stats.failed_files}",
+            "",
+            "    RECORDS SUMMARY:",
+            f"    ├─ Total Records: {stats.total_records:,}",
+            f"    ├─ Total eSIM: {stats.total_esim:,}",
+            f"    ├─ Out of Range: {stats.out_of_range:,}",
+            f"    └─ Invalid: {stats.invalid:,}",
+            "",
+            "    PROCESSING RESULTS:",
+            f"    ├─ ✅ Successful: {stats.successful:,} ({successful_pct:.1f}%)",
+            f"    │  ├─ Deactivated: {stats.deactivated:,}",
+            f"    │  └─ Already Expired: {stats.already_expired:,}",
+            f"    ├─ ❌ Failed: {stats.failed:,} ({failed_pct:.1f}%)",
+            f"    └─ ⏭️  Skipped: {stats.skipped:,}",
+            "",
+            "    PERFORMANCE:",
+            f"    ├─ Success Rate: {stats.success_rate:.1f}%",
+            f"    ├─ Avg Processing Time: {stats.avg_processing_time_ms:.0f}ms per record",
+            f"    └─ Total Processing Time: {stats.total_processing_time_s:.1f}s",
+            "",
+            _SUMMARY_FOOTER,
+        ))
 
     def prepare_email_data(self,
                       stats: ProcessingStats,
-                      results: List[ProcessingResult]) -> Dict[str, Any]:
+                      results: List[ProcessingResult],
+                      groups: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Prepare data for email template.
 
         Args:
             stats: Processing statistics
             results: Processing results
+            groups: Optional result of aggregate(results), to avoid aggregating again
 
         Returns:
             Dictionary with email template data
@@ -408,15 +558,17 @@ class ReportGenerator:
         # Get sample of failed records for email
         failed_samples = []
         for r in results:
-            if r.status == 'FAILED' and len(failed_samples) < 10:
+            if r.status == 'FAILED':
                 failed_samples.append({
                     'iccid': r.iccid,
                     'error': r.error_message or 'Erro desconhecido',
                     'file': r.file_source
                 })
+                if len(failed_samples) == FAILED_SAMPLE_SIZE:
+                    break
 
         # Generate summary table data
-        table_data = self.generate_summary_table(results)
+        table_data = self.generate_summary_table(results, groups)
 
         email_data = {
             'alert_type': alert_type,
@@ -454,16 +606,18 @@ class ReportGenerator:
             Tuple of (number of files deleted, list of deleted filenames)
         """
         deleted_files = []
-        cutoff_date = datetime.now() - timedelta(days=self.retention_days)
+        cutoff_ts = (datetime.now() - timedelta(days=self.retention_days)).timestamp()
 
         try:
-            for file_path in chain(self.report_dir.glob("*.csv"), self.report_dir.glob("*.json")):
-                # Check file modification time
-                file_mtime = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if file_mtime < cutoff_date:
-                    file_path.unlink()
-                    deleted_files.append(file_path.name)
-                    logger.debug(f"Deleted old report: {file_path.name}")
+            # scandir devolve DirEntry com stat em cache; compara-se o mtime em epoch diretamente
+            with os.scandir(self.report_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(REPORT_SUFFIXES) or not entry.is_file():
+                        continue
+                    if entry.stat().st_mtime < cutoff_ts:
+                        os.unlink(entry.path)
+                        deleted_files.append(entry.name)
+                        logger.debug(f"Deleted old report: {entry.name}")
 
             if deleted_files:
                 logger.info(f"Cleaned up {len(deleted_files)} old reports")
@@ -501,8 +655,10 @@ class ReportGenerator:
         }
 
         try:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, default=str)
+            # datetimes passam por default=str, como no json.dump original
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(report_data, default=str,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME))
 
             logger.info(f"JSON report saved: {json_path}")
             return str(json_path)
@@ -561,7 +717,7 @@ def generate_quick_report(results: List[Dict[str, Any]],
             msisdn=r.get('msisdn'),
             file_source=r.get('file_source', 'unknown'),
             timestamp=r.get('timestamp', datetime.now()),
-            status=r.get('status', 'UNKNOWN'),
+            status=sys.intern(r.get('status', 'UNKNOWN')),
             api_response=r.get('api_response'),
             error_message=r.get('error_message'),
             retry_attempts=r.get('retry_attempts', 0),
@@ -10,16 +10,29 @@ Provides:
 
 from __future__ import annotations
 import logging
-from dataclasses import dataclass
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Any
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional, Any
 import xml.etree.ElementTree as ET
 
+try:  # lxml é opcional: parser C mais rápido; sem ele usa-se o iterparse da stdlib
+    from lxml import etree as LET
+except ImportError:
+    LET = None
+
 from core.business_rules import EsimRange, get_default_rules
 
 logger = logging.getLogger(__name__)
 
+# Formatos de StatusDate mais comuns (evitam datetime.strptime por registo)
+_US_DATE_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})\s+(\d{1,2}):(\d{1,2}):(\d{1,2})$")  # %m/%d/%y|%Y %H:%M:%S
+_ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{1,2}):(\d{1,2})$")  # %Y-%m-%dT%H:%M:%S
+
 
 class XMLProcessingError(Exception):
     """Base error for XML processing issues."""
@@ -31,7 +44,7 @@ class XMLValidationError(XMLProcessingError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class NginRecord:
     iccid: str
     imsi: Optional[str] = None
@@ -46,7 +59,7 @@ class XMLProcessor:
     Processes a Siebel NGIN XML file and identifies eSIM ICCIDs.
 
     Usage:
-        processor = XMLProcessor()
+        processor = XMLProcessor()  # keep_raw=True para manter NginRecord.raw nos registos válidos
         records, invalids = processor.parse_file("path/to/file.xml")
         esim_iccids = processor.filter_esim_iccids(records)
     """
@@ -54,52 +67,114 @@ class XMLProcessor:
     # expected element path under root: ListOfCvtNginPrepaidDataIo / CvtNginPrepaidData
     ITEM_TAG = "CvtNginPrepaidData"
 
-    def __init__(self, esim_range: Optional[EsimRange] = None):
+    def __init__(self, esim_range: Optional[EsimRange] = None, keep_raw: bool = False):
         # load default rules if not provided
         if esim_range is None:
             esim_range, _ = get_default_rules()
         self.esim_range = esim_range
+        # keep_raw: manter o dicionário de campos originais também nos registos válidos (diagnóstico);
+        # por omissão só os inválidos o guardam, para não reter os campos de todo o ficheiro em memória
+        self.keep_raw = keep_raw
+        # verificador do intervalo resolvido uma vez (lote quando disponível, senão por ICCID)
+        self._is_esim_many = getattr(esim_range, "is_esim_many", None)
+        self._is_esim = esim_range.is_esim
         logger.debug("XMLProcessor initialized with EsimRange: %s", self.esim_range)
 
     def _parse_status_date(self, date_str: Optional[str]) -> Optional[datetime]:
         if not date_str:
             return None
+        date_str = date_str.strip()
+
+        # fast path: formatos numéricos conhecidos via regex pré-compilada
+        m = _US_DATE_RE.match(date_str)
+        if m:
+            month, day, year, hour, minute, second = map(int, m.groups())
+            if len(m.group(3)) == 2:
+                year += 2000 if year < 69 else 1900  # mesma regra de pivot que %y
+        else:
+            m = _ISO_DATE_RE.match(date_str)
+            if m:
+                year, month, day, hour, minute, second = map(int, m.groups())
+        if m:
+            try:
+                return datetime(year, month, day, hour, minute, second)
+            except ValueError:
+                pass
+
         # Try multiple formats commonly found; expand if necessary
         formats = ["%m/%d/%y %H:%M:%S", "%m/%d/%Y %H:%M:%S", "%Y-%m-%dT%H:%M:%S"]
         for fmt in formats:
             try:
-                return datetime.strptime(date_str.strip(), fmt)
+                return datetime.strptime(date_str, fmt)
             except Exception:
                 continue
         # fallback: return None but log
         logger.debug("Unrecognized date format: %r", date_str)
         return None
 
-    def parse_file(self, xml_path: str) -> Tuple[List[NginRecord], List[Tuple[Dict, str]]]:
+    def _iter_items(self, xml_path: Path) -> Iterator[Any]:
+        """
+        Stream the ITEM_TAG elements of the file, freeing each one after it is consumed,
+        so only the current record is kept in memory.
+        Raises XMLValidationError on malformed XML.
+        """
+        try:
+            if LET is not None:
+                context = LET.iterparse(str(xml_path), events=("end",), tag=self.ITEM_TAG,
+                                         resolve_entities=False, remove_comments=True, remove_pis=True)
+                for _, it in context:
+                    yield it
+                    it.clear()
+                    # remover irmãos já processados para o root não crescer
+                    while it.getprevious() is not None:
+                        del it.getparent()[0]
+            else:
+                # a stdlib não tem getparent(): pilha de elementos abertos para desligar
+                # cada item já processado do pai (senão o root acumula itens vazios)
+                open_elems = []
+                for event, it in ET.iterparse(str(xml_path), events=("start", "end")):
+                    if event == "start":
+                        open_elems.append(it)
+                        continue
+                    open_elems.pop()
+                    if it.tag == self.ITEM_TAG:
+                        yield it
+                        it.clear()
+                        if open_elems:
+                            open_elems[-1].remove(it)
+        except ET.ParseError as e:
+            raise XMLValidationError(f"Malformed XML: {e}") from e
+        except Exception as e:
+            if LET is not None and isinstance(e, LET.XMLSyntaxError):
+                raise XMLValidationError(f"Malformed XML: {e}") from e
+            raise
+
+    def parse_file(self, xml_path: str, esim_only: bool = False) -> Tuple[List[NginRecord], List[Tuple[Dict, str]]]:
         """
         Parse and validate the XML file.
         Returns (valid_records, invalid_records)
         invalid_records is a list of tuples (raw_fields_dict, reason)
+        With esim_only=True, valid ICCIDs outside esim_range are dropped before the
+        NginRecord is built (no StatusDate parsing for them).
         """
+        valid_records, invalid_records, _ = self._parse(xml_path, esim_only)
+        return valid_records, invalid_records
+
+    def _parse(self, xml_path: str, esim_only: bool) -> Tuple[List[NginRecord], List[Tuple[Dict, str]], int]:
+        """parse_file, also returning how many valid records were dropped by esim_only."""
         p = Path(xml_path)
         if not p.exists():
             raise XMLValidationError(f"File not found: {xml_path}")
-        try:
-            tree = ET.parse(str(p))
-            root = tree.getroot()
-        except ET.ParseError as e:
-            raise XMLValidationError(f"Malformed XML: {e}") from e
-
-        # find all CvtNginPrepaidData nodes (namespaces are absent in sample)
-        items = root.findall(".//" + self.ITEM_TAG)
-        if not items:
-            # Try alternative: some siebel exports have different casing/namespace
-            raise XMLValidationError(f"No '{self.ITEM_TAG}' elements found in XML.")
 
         valid_records: List[NginRecord] = []
         invalid_records: List[Tuple[Dict, str]] = []
+        item_count = 0
+        out_of_range = 0
+        is_esim = self._is_esim
 
-        for it in items:
+        # stream CvtNginPrepaidData nodes (namespaces are absent in sample)
+        for it in self._iter_items(p):
+            item_count += 1
             raw = {}
             # extract known child elements
             for child in it:
@@ -122,8 +197,8 @@ class XMLProcessor:
             # Clean ICCID (remove whitespace, non-printable)
             iccid_clean = "".join(ch for ch in str(iccid).strip() if ch.isprintable())
             # optionally remove non-digit characters (but ICCIDs normally numeric, sometimes hex)
-            # We'll leave as-is but validate digits:
-            if not iccid_clean.isdigit():
+            # We'll leave as-is but validate ASCII digits (str.isdigit alone accepts e.g. '²' or Arabic-Indic digits):
+            if not (iccid_clean.isascii() and iccid_clean.isdigit()):
                 # still accept if hex? depending on your system. Here we treat non-digit as invalid.
                 invalid_records.append((raw, "ICCID not numeric"))
                 logger.debug("ICCID not numeric: %r", iccid_clean)
@@ -135,6 +210,10 @@ class XMLProcessor:
                 logger.debug("ICCID length invalid: %s (len=%d)", iccid_clean, len(iccid_clean))
                 continue
 
+            if esim_only and not is_esim(iccid_clean):
+                out_of_range += 1
+                continue
+
             status_date = self._parse_status_date(status_date_raw)
             rec = NginRecord(
                 iccid=iccid_clean,
@@ -142,25 +221,55 @@ class XMLProcessor:
                 msisdn=(msisdn.strip() if msisdn else None),
                 action=(action.strip() if action else None),
                 status_date=status_date,
-                raw=raw
+                raw=raw if self.keep_raw else None
             )
             valid_records.append(rec)
 
-        logger.info("Parsed %d valid records and %d invalid records from %s", len(valid_records), len(invalid_records), xml_path)
-        return valid_records, invalid_records
+        if not item_count:
+            # Try alternative: some siebel exports have different casing/namespace
+            raise XMLValidationError(f"No '{self.ITEM_TAG}' elements found in XML.")
+
+        if esim_only:
+            logger.info("Parsed %d eSIM records (%d valid out of range) and %d invalid records from %s",
+                        len(valid_records), out_of_range, len(invalid_records), xml_path)
+        else:
+            logger.info("Parsed %d valid records and %d invalid records from %s", len(valid_records), len(invalid_records), xml_path)
+        return valid_records, invalid_records, out_of_range
+
+    def parse_many(self, xml_paths: Iterable[str], workers: Optional[int] = None,
+                   esim_only: bool = False) -> List[Tuple[List[NginRecord], List[Tuple[Dict, str]]]]:
+        """
+        parse_file over several files in parallel worker processes (parsing is CPU-bound).
+        Returns one (valid_records, invalid_records) tuple per path, in input order.
+        Only the esim_range and flags are sent to the workers; a single file (or workers=1)
+        is parsed in-process.
+        """
+        paths = [str(p) for p in xml_paths]
+        workers = min(workers or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            return [self.parse_file(p, esim_only) for p in paths]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_one, paths, repeat(self.esim_range), repeat(self.keep_raw),
+                                     repeat(esim_only), chunksize=4))
 
     def filter_esim_iccids(self, records: List[NginRecord]) -> List[NginRecord]:
         """
         Returns the subset of records whose ICCIDs match the esim_range.
+        The range check runs in batch (EsimRange.is_esim_many) over all ICCIDs at once;
+        ranges exposing only is_esim are checked record by record.
         """
-        esims = []
-        for rec in records:
-            if self.esim_range.is_esim(rec.iccid):
-                esims.append(rec)
+        is_esim_many = self._is_esim_many
+        if is_esim_many is not None:
+            mask = is_esim_many([rec.iccid for rec in records])
+        else:
+            is_esim = self._is_esim
+            mask = [is_esim(rec.iccid) for rec in records]
+        esims = [rec for rec, is_esim in zip(records, mask) if is_esim]
         logger.info("Identified %d eSIM ICCIDs from %d records", len(esims), len(records))
         return esims
 
-    def extract_esim_list_from_file(self, xml_path: str) -> Dict[str, Any]:
+    def extract_esim_list_from_file(self, xml_path: str, esim_only: bool = False) -> Dict[str, Any]:
         """
         High level helper: parse file, filter eSIMs, and produce a structured result dictionary
         {
@@ -171,15 +280,27 @@ class XMLProcessor:
             "esim_records": [ {iccid, msisdn, imsi, ...}, ... ],
             "invalid_records": [ {raw, reason}, ... ]
         }
+        esim_only=True filters by range while parsing; the counts are the same either way.
         """
-        valid, invalid = self.parse_file(xml_path)
-        esims = self.filter_esim_iccids(valid)
+        if esim_only:
+            esims, invalid, out_of_range = self._parse(xml_path, esim_only=True)
+            valid_count = len(esims) + out_of_range
+        else:
+            valid, invalid = self.parse_file(xml_path)
+            esims = self.filter_esim_iccids(valid)
+            valid_count = len(valid)
 
         return {
-            "total_records": len(valid) + len(invalid),
-            "valid_records": len(valid),
+            "total_records": valid_count + len(invalid),
+            "valid_records": valid_count,
             "invalid_records": len(invalid),
             "esim_count": len(esims),
-            "esim_records": [rec.__dict__ for rec in esims],
+            "esim_records": [asdict(rec) for rec in esims],
             "invalid_details": invalid
         }
+
+
+def _parse_one(xml_path: str, esim_range: EsimRange, keep_raw: bool,
+               esim_only: bool) -> Tuple[List[NginRecord], List[Tuple[Dict, str]]]:
+    """Worker de XMLProcessor.parse_many (função de topo para ser serializável por pickle)."""
+    return XMLProcessor(esim_range=esim_range, keep_raw=keep_raw).parse_file(xml_path, esim_only)
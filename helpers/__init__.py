@@ -1,10 +1,33 @@
 
 # __init__.py for Aniversário Colaboradores project
 
-# Importing modules to expose them as part of the package interface
-from pprint import pprint
-from .configuration import load_json_config, load_ini_config, load_env_config
-from helpers.email_sender import EmailSender
-from helpers.exception_handler import ExceptionHandler
-from helpers.logger_manager import LoggerManager
-from helpers.database import DatabaseFactory, DatabaseConnectionError, PostgresqlGenericCRUD
+# Exposing modules as part of the package interface. The imports are lazy (PEP 562):
+# `from helpers.configuration import ...` no longer pulls in the email, database, etc. helpers.
+import importlib
+
+_LAZY = {
+    "load_json_config": ".configuration",
+    "load_ini_config": ".configuration",
+    "load_env_config": ".configuration",
+    "EmailSender": ".email_sender",
+    "ExceptionHandler": ".exception_handler",
+    "LoggerManager": ".logger_manager",
+    "DatabaseFactory": ".database",
+    "DatabaseConnectionError": ".database",
+    "PostgresqlGenericCRUD": ".database",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # próximos acessos não passam por __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
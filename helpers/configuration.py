@@ -1,11 +1,17 @@
 import json
 import logging
+from functools import lru_cache
 from configparser import ConfigParser, NoOptionError, NoSectionError
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from dotenv import dotenv_values
 import os
 
+try:  # orjson é opcional aqui: parser JSON mais rápido; sem ele usa-se o json da stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent.parent  # Go up one level from core/ to project root
 
@@ -14,10 +20,46 @@ JSON_PATH = SCRIPT_DIR / 'configs' / 'configs.json'
 INI_PATH = SCRIPT_DIR / 'configs' / 'config.ini'
 DOTENV_PATH = SCRIPT_DIR / 'configs' / '.env'
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging (only if the application hasn't configured the root logger yet)
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cache dos ficheiros de configuração por (caminho, mtime_ns, tamanho): um ficheiro
+# alterado gera uma chave nova e é lido de novo
+def _file_version(path) -> Tuple[str, int, int]:
+    st = os.stat(path)
+    return str(path), st.st_mtime_ns, st.st_size
+
+@lru_cache(maxsize=32)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    if orjson is not None:
+        # orjson.JSONDecodeError é subclasse de json.JSONDecodeError
+        with open(path, 'rb') as file:
+            return orjson.loads(file.read())
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+@lru_cache(maxsize=32)
+def _load_ini_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, str]]:
+    # config.ini só usa 'chave = valor', sem interpolação '%(...)s' nem comentários em linha
+    conf = ConfigParser(interpolation=None, delimiters=('=',), inline_comment_prefixes=None)
+    with open(path, 'r', encoding='utf-8') as file:
+        conf.read_file(file)
+    return {section: dict(conf.items(section)) for section in conf.sections()}
+
+@lru_cache(maxsize=32)
+def _load_env_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Optional[str]]:
+    return dotenv_values(path)
+
+def _copy_json(value: Any) -> Any:
+    """Cópia estrutural de dados JSON (dict/list), mais barata que copy.deepcopy."""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
+
 def load_json_config(config_file: Optional[str] = None) -> dict:
     """
     Load static variables from a JSON configuration file.
@@ -40,8 +82,8 @@ def load_json_config(config_file: Optional[str] = None) -> dict:
         config_file = SCRIPT_DIR / 'config' / config_file
 
     try:
-        with open(config_file, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        # parse em cache até o ficheiro mudar; devolve-se uma cópia (os chamadores alteram-na)
+        return _copy_json(_load_json_cached(*_file_version(config_file)))
     except FileNotFoundError as e:
         logger.error(f"Configuration file '{config_file}' not found.")
         raise FileNotFoundError(f"Configuration file '{config_file}' not found.") from e
@@ -63,18 +105,18 @@ def load_ini_config(section: str) -> dict:
         FileNotFoundError: If the INI configuration file is not found.
         ValueError: If the section is not found.
     """
-    if not INI_PATH.exists():
+    try:
+        # todas as secções são lidas num único parse, partilhado por todas as chamadas
+        sections = _load_ini_cached(*_file_version(INI_PATH))
+    except FileNotFoundError as e:
         logger.error(f"INI configuration file '{INI_PATH}' not found.")
-        raise FileNotFoundError(f"INI configuration file '{INI_PATH}' not found.")
-
-    conf = ConfigParser()
-    conf.read(INI_PATH)
+        raise FileNotFoundError(f"INI configuration file '{INI_PATH}' not found.") from e
 
-    if not conf.has_section(section):
+    if section not in sections:
         logger.error(f"Section '{section}' not found in '{INI_PATH}'.")
         raise ValueError(f"Section '{section}' not found in '{INI_PATH}'.")
 
-    return dict(conf.items(section))
+    return dict(sections[section])
 
 def load_env_config() -> dict:
     """
@@ -90,5 +132,5 @@ def load_env_config() -> dict:
         logger.error(f"Environment file '{DOTENV_PATH}' not found.")
         raise FileNotFoundError(f"Environment file '{DOTENV_PATH}' not found.")
 
-    env_vars = dotenv_values(DOTENV_PATH)
+    env_vars = dict(_load_env_cached(*_file_version(DOTENV_PATH)))
     return env_vars
@@ -168,3 +168,21 @@ class PostgresqlGenericCRUD:
         except Exception as e:
             logger.error(f"Failed to delete records. Error: {e}")
             raise
+
+    def execute_raw_query(self, query: str, params: Tuple[Any] = None) -> Any:
+        """
+        Execute a raw SQL statement (DDL, upserts, ...) that does not fit the CRUD helpers.
+
+        Args:
+            query (str): The SQL statement.
+            params (tuple, optional): Tuple of parameters for the statement.
+
+        Returns:
+            list: Records as dictionaries for SELECT statements.
+            int: Number of affected rows for other statements.
+        """
+        try:
+            return self.db_client.execute_query(query, params, fetch_as_dict=True)
+        except Exception as e:
+            logger.error(f"Failed to execute query. Error: {e}")
+            raise
@@ -1,25 +1,91 @@
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 import logging
-from chardet import detect
 import csv
-from typing import List, Tuple
+import io
+import mmap
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from statistics import pvariance
+from typing import Dict, Iterable, List, Optional, Tuple
 from .models import ReportMetadata
 
+try:  # cchardet (faust-cchardet) é opcional: detetor em C (uchardet); sem ele usa-se o chardet
+    import cchardet as chardet
+except ImportError:
+    import chardet
+
+try:  # pyarrow é opcional: leitor CSV multithread (FileReader(csv_engine='pyarrow'))
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
+try:  # python-calamine é opcional: leitor Excel em Rust (xls e xlsx); sem ele usa-se o motor por omissão do pandas
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = None
+
 logger = logging.getLogger(__name__)
 
+# Motores de leitura de CSV suportados por FileReader
+CSV_ENGINES = ('pandas', 'pyarrow')
+
+# Deteção de encoding em streaming: blocos de 1 MiB, no máximo 10 MiB por ficheiro
+# (ficheiros ASCII podem nunca atingir confiança suficiente)
+DETECT_CHUNK_SIZE = 1 << 20
+DETECT_MAX_BYTES = 10 << 20
+
+# Ficheiros TXT até este tamanho são lidos e descodificados de uma só vez; acima disso, linha a linha
+READ_ALL_MAX_BYTES = 200 << 20
+
+# Célula numérica com vírgulas/pontos (após strip): remover ',' e '.' deixa '-?' + dígitos
+_NUMERIC_CELL_PATTERN = r'[.,]*-?[.,]*\d[\d.,]*'
+
+# Candidatos passados ao csv.Sniffer em detect_delimiter (mesmos do cálculo por variância)
+_SNIFF_DELIMITERS = ',;\t|'
+
+# BOMs reconhecidos antes do detetor estatístico (UTF-32 antes de UTF-16: partilham o prefixo FF FE)
+_BOM_ENCODINGS = {
+    b'\x00\x00\xfe\xff': 'utf-32',
+    b'\xff\xfe\x00\x00': 'utf-32',
+    b'\xef\xbb\xbf': 'utf-8-sig',
+    b'\xff\xfe': 'utf-16',
+    b'\xfe\xff': 'utf-16',
+}
+
+# Leitor por extensão de texto (.lst é tratado como CSV com delimiter específico)
+_TEXT_READERS = {
+    '.csv': 'read_csv_file',
+    '.lst': 'read_csv_file',
+    '.txt': 'read_txt_file',
+}
+_EXCEL_EXTENSIONS = frozenset({'.xlsx', '.xls'})
+
 class FileReader:
-    def __init__(self):
-        self.supported_extensions = {'.csv', '.xlsx', '.txt', '.xls', '.lst'}
+    def __init__(self, csv_engine: str = 'pandas'):
+        """
+        Args:
+            csv_engine (str): 'pandas' (default) or 'pyarrow' for the multithreaded pyarrow.csv
+                parser in read_csv_file; 'pyarrow' falls back to pandas when pyarrow is missing
+        """
+        if csv_engine not in CSV_ENGINES:
+            raise ValueError(f"Unsupported csv_engine: {csv_engine}")
+        self.supported_extensions = set(_TEXT_READERS) | _EXCEL_EXTENSIONS
+        self.csv_engine = csv_engine
 
-    def detect_file_encoding(file_path):
+    @staticmethod
+    def detect_file_encoding(file_path: Path) -> str:
         """
         Função melhorada para detectar encoding de ficheiros
         Tenta múltiplos encodings comuns para ficheiros de cupões
+        Usa cchardet quando instalado (mesma interface detect() do chardet).
+        Método estático: chamado como self.detect_file_encoding(path) ou FileReader.detect_file_encoding(path).
         """
-        import chardet
-        from pathlib import Path
-
         # Encodings mais comuns para ficheiros de sistemas legados
         encodings_to_try = [
             'latin1',       # ISO-8859-1 (muito comum em sistemas Windows antigos)
@@ -31,34 +97,49 @@ class FileReader:
         ]
 
         try:
-            # Primeiro tentar detecção automática
-            with open(file_path, 'rb') as f:
-                raw_data = f.read(4096)  # Ler primeiros 4KB
-
-            result = chardet.detect(raw_data)
-            if result['confidence'] > 0.8:
-                detected_encoding = result['encoding']
-                print(f"Auto-detected encoding: {detected_encoding} (confidence: {result['confidence']:.2f})")
-                return detected_encoding
+            # ficheiro mapeado em memória uma só vez (sem cópias para o heap na leitura)
+            with _mapped_file(file_path) as data:
+                # BOM no início do ficheiro dispensa a deteção estatística
+                head = data[:4]
+                for bom, bom_encoding in _BOM_ENCODINGS.items():
+                    if head.startswith(bom):
+                        logger.info(f"Detected BOM encoding: {bom_encoding}")
+                        return bom_encoding
+
+                try:
+                    # Primeiro tentar detecção automática, em blocos até o detetor concluir
+                    detector = chardet.UniversalDetector()
+                    limit = min(len(data), DETECT_MAX_BYTES)
+                    for start in range(0, limit, DETECT_CHUNK_SIZE):
+                        detector.feed(data[start:min(start + DETECT_CHUNK_SIZE, limit)])
+                        if detector.done:
+                            break
+                    detector.close()
+
+                    result = detector.result
+                    if (result['confidence'] or 0) > 0.8:  # cchardet devolve None sem deteção
+                        detected_encoding = result['encoding']
+                        logger.info(f"Auto-detected encoding: {detected_encoding} (confidence: {result['confidence']:.2f})")
+                        return detected_encoding
+                except Exception as e:
+                    logger.warning(f"Auto-detection failed: {e}")
+
+                # Se auto-detecção falhou, tentar encodings manualmente sobre o mesmo mapeamento
+                for encoding in encodings_to_try:
+                    try:
+                        str(data, encoding)
+                        logger.info(f"Successfully read file with encoding: {encoding}")
+                        return encoding
+                    except UnicodeDecodeError:
+                        continue
+                    except Exception as e:
+                        logger.warning(f"Error with encoding {encoding}: {e}")
+                        continue
         except Exception as e:
-            print(f"Auto-detection failed: {e}")
-
-        # Se auto-detecção falhou, tentar encodings manualmente
-        for encoding in encodings_to_try:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    # Tentar ler o ficheiro inteiro
-                    f.read()
-                print(f"Successfully read file with encoding: {encoding}")
-                return encoding
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                print(f"Error with encoding {encoding}: {e}")
-                continue
+            logger.warning(f"Error reading file: {e}")
 
         # Se nada funcionou, usar latin1 como fallback (nunca falha)
-        print("Using fallback encoding: latin1")
+        logger.warning("Using fallback encoding: latin1")
         return 'latin1'
 
 
@@ -79,21 +160,18 @@ class FileReader:
         if file_path.suffix.lower() not in self.supported_extensions:
             raise ValueError(f"Unsupported file extension: {file_path.suffix}")
 
-    def preprocess_txt(self, file_path: Path, metadata: ReportMetadata, encoding: str) -> Path:
+    def _resolve_txt_delimiter(self, file_path: Path, metadata: ReportMetadata, encoding: str) -> str:
         """
-        Preprocess the TXT file, handling fixed-width or custom-delimited formats with dynamic delimiter detection.
+        Resolve the TXT delimiter from metadata (name or raw character), auto-detecting it otherwise.
 
         Args:
-            file_path (Path): Path to the original TXT file
+            file_path (Path): Path to the TXT file
             metadata (ReportMetadata): File metadata
             encoding (str): File encoding
 
         Returns:
-            Path: Path to the preprocessed file
+            str: Effective delimiter
         """
-        processed_lines = []
-        invalid_rows = []
-
         # Define possible delimiters with their escape sequences
         DELIMITER_MAP = {
             'tab': '\t',
@@ -106,27 +184,50 @@ class FileReader:
             'colon': ':',
         }
 
+        # Determine the delimiter
+        specified_delimiter = metadata.delimiter.lower() if metadata.delimiter else None
+        effective_delimiter = None
+
+        if specified_delimiter:
+            # Check if it's a known delimiter name
+            if specified_delimiter in DELIMITER_MAP:
+                effective_delimiter = DELIMITER_MAP[specified_delimiter]
+            # Check if it's a raw delimiter character
+            elif len(specified_delimiter) == 1:
+                effective_delimiter = specified_delimiter
+            else:
+                logger.warning(f"Unrecognized delimiter '{specified_delimiter}', attempting auto-detection")
+
+        # If no valid delimiter specified, attempt auto-detection
+        if not effective_delimiter:
+            effective_delimiter = self.detect_delimiter(file_path, encoding)
+            logger.info(f"Auto-detected delimiter: {repr(effective_delimiter)}")
+
+        return effective_delimiter
+
+    def preprocess_txt(self, file_path: Path, metadata: ReportMetadata, encoding: str) -> io.StringIO:
+        """
+        Preprocess the TXT file, handling fixed-width or custom-delimited formats with dynamic delimiter detection.
+
+        Args:
+            file_path (Path): Path to the original TXT file
+            metadata (ReportMetadata): File metadata
+            encoding (str): File encoding
+
+        Returns:
+            io.StringIO: Preprocessed rows as CSV text, positioned at the start
+        """
+        total_lines = 0
+        invalid_rows = []
+
         try:
-            # Determine the delimiter
-            specified_delimiter = metadata.delimiter.lower() if metadata.delimiter else None
-            effective_delimiter = None
-
-            if specified_delimiter:
-                # Check if it's a known delimiter name
-                if specified_delimiter in DELIMITER_MAP:
-                    effective_delimiter = DELIMITER_MAP[specified_delimiter]
-                # Check if it's a raw delimiter character
-                elif len(specified_delimiter) == 1:
-                    effective_delimiter = specified_delimiter
-                else:
-                    logger.warning(f"Unrecognized delimiter '{specified_delimiter}', attempting auto-detection")
+            effective_delimiter = self._resolve_txt_delimiter(file_path, metadata, encoding)
 
-            # If no valid delimiter specified, attempt auto-detection
-            if not effective_delimiter:
-                effective_delimiter = self.detect_delimiter(file_path, encoding)
-                logger.info(f"Auto-detected delimiter: {repr(effective_delimiter)}")
+            # Processed lines go straight into an in-memory CSV buffer for pandas
+            processed_file = io.StringIO(newline='')
+            writer = csv.writer(processed_file)
 
-            with open(file_path, 'r', encoding=encoding) as file:
+            with _text_lines(file_path, encoding) as file:
                 # Skip initial rows if specified
                 for _ in range(metadata.skip_rows):
                     next(file)
@@ -145,33 +246,28 @@ class FileReader:
                             for width in metadata.column_widths:
                                 fields.append(line[start:start + width].strip())
                                 start += width
-                            processed_line = fields
+                            writer.writerow(fields)
                         else:
                             # Split using the determined delimiter
                             if effective_delimiter == ' ':
-                                # Handle multiple spaces
-                                processed_line = ' '.join(line.split()).split(effective_delimiter)
+                                # Handle multiple spaces (runs of whitespace count as one separator)
+                                processed_line = line.split()
                             else:
                                 processed_line = line.split(effective_delimiter)
 
-                            # Clean up each field
-                            processed_line = [field.strip() for field in processed_line]
+                            # Clean up each field while writing the row
+                            writer.writerow(map(str.strip, processed_line))
 
-                        processed_lines.append(processed_line)
+                        total_lines += 1
 
                     except Exception as e:
                         logger.warning(f"Error processing line {line_number}: {str(e)}")
                         invalid_rows.append((line_number, line))
                         continue
 
-            # Save processed lines to a temporary CSV file
-            processed_file = file_path.with_name(f"processed_{file_path.name}.csv")
-            with open(processed_file, 'w', newline='', encoding=encoding) as file:
-                writer = csv.writer(file)
-                writer.writerows(processed_lines)
+            processed_file.seek(0)
 
             # Log processing summary
-            total_lines = len(processed_lines)
             invalid_count = len(invalid_rows)
             logger.info(f"Processed {total_lines} lines with delimiter: {repr(effective_delimiter)}")
             if invalid_rows:
@@ -188,6 +284,7 @@ class FileReader:
     def detect_delimiter(self, file_path: Path, encoding: str) -> str:
         """
         Detect the delimiter used in a file by analyzing the first few lines.
+        Cached per (path, mtime, size, encoding); see _cached_delimiter.
 
         Args:
             file_path (Path): Path to the file
@@ -196,6 +293,14 @@ class FileReader:
         Returns:
             str: Detected delimiter
         """
+        key = _file_key(file_path)
+        if key is None:
+            return self._sniff_delimiter(file_path, encoding)
+        return _cached_delimiter(*key, encoding)
+
+    @staticmethod
+    def _sniff_delimiter(file_path: Path, encoding: str) -> str:
+        """Uncached delimiter detection (body of detect_delimiter)."""
         possible_delimiters = [',', ';', '\t', '|']
         try:
             with open(file_path, 'r', encoding=encoding) as file:
@@ -213,36 +318,41 @@ class FileReader:
                     logger.warning("Empty file or no valid lines found")
                     return ','
 
-                # Join the sample lines
-                sample = ''.join(sample_lines)
+                # csv.Sniffer resolves the common case (and quoted delimiters) directly;
+                # the scoring below is only used when it cannot decide
+                try:
+                    best_delimiter = csv.Sniffer().sniff(''.join(sample_lines), delimiters=_SNIFF_DELIMITERS).delimiter
+                    logger.info(f"Detected delimiter: {repr(best_delimiter)}")
+                    return best_delimiter
+                except csv.Error:
+                    pass
+
+                # Count occurrences outside quoted fields, per line
+                per_line = [_count_outside_quotes(line, possible_delimiters) for line in sample_lines]
 
-                # Count occurrences and calculate consistency
                 delimiter_stats = {}
                 for delimiter in possible_delimiters:
-                    # Count occurrences in each line
-                    line_counts = [line.count(delimiter) for line in sample_lines]
+                    line_counts = [counts[delimiter] for counts in per_line]
 
                     if not any(line_counts):  # Skip if delimiter not found
                         continue
 
-                    # Calculate consistency score
-                    avg_count = sum(line_counts) / len(line_counts)
-                    consistency = sum(1 for count in line_counts if count == line_counts[0]) / len(line_counts)
-
                     delimiter_stats[delimiter] = {
                         'total_count': sum(line_counts),
-                        'avg_count': avg_count,
-                        'consistency': consistency
+                        'avg_count': sum(line_counts) / len(line_counts),
+                        'variance': pvariance(line_counts),
+                        'on_every_line': all(line_counts)
                     }
 
                 if not delimiter_stats:
                     logger.warning("No common delimiters found")
                     return ','
 
-                # Choose the best delimiter based on consistency and frequency
-                best_delimiter = max(
+                # Prefer delimiters present on every line, then the most regular count
+                # (lowest variance), then the highest count per line
+                best_delimiter = min(
                     delimiter_stats.items(),
-                    key=lambda x: (x[1]['consistency'], x[1]['avg_count'])
+                    key=lambda x: (not x[1]['on_every_line'], x[1]['variance'], -x[1]['avg_count'])
                 )[0]
 
                 # Log detailed detection information
@@ -255,7 +365,7 @@ class FileReader:
             logger.warning(f"Error detecting delimiter: {str(e)}. Defaulting to comma.")
             return ','
 
-    def preprocess_csv(self, file_path: Path, metadata: ReportMetadata, encoding: str) -> Path:
+    def preprocess_csv(self, file_path: Path, metadata: ReportMetadata, encoding: str) -> io.StringIO:
         """
         Preprocess the CSV file to handle mismatched rows and decimal commas.
 
@@ -265,7 +375,7 @@ class FileReader:
             encoding (str): File encoding
 
         Returns:
-            Path: Path to the preprocessed file
+            io.StringIO: Preprocessed rows as CSV text, positioned at the start
         """
         processed_lines = []
         invalid_rows = []
@@ -300,17 +410,8 @@ class FileReader:
                         invalid_rows.append((row_number, row))
                         continue
 
-                    # Replace commas with dots in numeric fields
-                    cleaned_row = []
-                    for cell in row:
-                        # Check if the cell might be a numeric value with a comma
-                        test_cell = cell.replace(",", "").replace(".", "").strip()
-                        if test_cell.isdigit() or (test_cell.startswith('-') and test_cell[1:].isdigit()):
-                            cleaned_row.append(cell.replace(",", "."))
-                        else:
-                            cleaned_row.append(cell)
-
-                    processed_lines.append(cleaned_row)
+                    # Decimal commas are normalized column-wise after loading (see _normalize_decimal_commas)
+                    processed_lines.append(row)
 
             # Log invalid rows
             if invalid_rows:
@@ -318,19 +419,45 @@ class FileReader:
                 for row_number, row in invalid_rows:
                     logger.debug(f"Invalid row at line {row_number}: {row}")
 
-            # Save processed lines to a temporary file
-            processed_file = file_path.with_name(f"processed_{file_path.name}")
-            with open(processed_file, 'w', newline='', encoding=encoding) as file:
-                writer = csv.writer(file, delimiter=delimiter)
-                writer.writerows(processed_lines)
+            # Keep processed lines in an in-memory CSV buffer for pandas
+            processed_file = io.StringIO(newline='')
+            csv.writer(processed_file, delimiter=delimiter).writerows(processed_lines)
+            processed_file.seek(0)
 
-            logger.info(f"Preprocessed CSV saved to: {processed_file}")
+            logger.info(f"Preprocessed CSV {file_path.name}: {len(processed_lines)} rows")
             return processed_file
 
         except Exception as e:
             logger.error(f"Error preprocessing CSV file {file_path}: {str(e)}")
             raise
 
+    @staticmethod
+    def _normalize_decimal_commas(df: pd.DataFrame, skip_first_row: bool = False) -> pd.DataFrame:
+        """
+        Replace commas with dots in numeric-looking cells, one vectorized pass per column.
+
+        A cell qualifies when, ignoring surrounding whitespace and any ',' or '.', it is an
+        optionally negative run of digits (e.g. '1.234,5', '-3,0').
+
+        Args:
+            df (pd.DataFrame): Data loaded with dtype=str
+            skip_first_row (bool): Leave the first row untouched (header read as data)
+
+        Returns:
+            pd.DataFrame: The same DataFrame, cleaned in place
+        """
+        for col in df.columns:
+            values = df[col]
+            if not pd.api.types.is_string_dtype(values):
+                continue
+            # empty cells (NaN) never match
+            mask = values.str.strip().str.fullmatch(_NUMERIC_CELL_PATTERN).fillna(False).astype(bool)
+            if skip_first_row and len(mask):
+                mask.iloc[0] = False
+            if mask.any():
+                df.loc[mask, col] = values[mask].str.replace(',', '.', regex=False)
+        return df
+
     def read_txt_file(self, file_path: Path, metadata: ReportMetadata, encoding: str) -> pd.DataFrame:
         """
         Read TXT file with error handling and preprocessing.
@@ -344,7 +471,8 @@ class FileReader:
             pd.DataFrame: Loaded data
         """
         try:
-            # Preprocess the TXT file to CSV format
+            # Preprocess the TXT file to CSV rows (lines stripped before splitting, so a leading
+            # delimiter never adds a field that pandas would take as the index)
             processed_file = self.preprocess_txt(file_path, metadata, encoding)
 
             # Configure pandas read options
@@ -361,13 +489,8 @@ class FileReader:
                     'date_format': metadata.date_format
                 })
 
-            # Read the preprocessed file
-            df = pd.read_csv(**read_options)
-
-            # Clean up the temporary file
-            processed_file.unlink()
-
-            return df
+            # Read the preprocessed buffer
+            return pd.read_csv(**read_options)
 
         except Exception as e:
             logger.error(f"Error reading TXT file {file_path}: {str(e)}")
@@ -385,6 +508,9 @@ class FileReader:
         Returns:
             pd.DataFrame: Loaded data
         """
+        if self.csv_engine == 'pyarrow' and pacsv is not None:
+            return self._read_csv_pyarrow(file_path, metadata, encoding)
+
         try:
             # Preprocess the CSV file
             processed_file = self.preprocess_csv(file_path, metadata, encoding)
@@ -406,18 +532,74 @@ class FileReader:
                     'date_format': metadata.date_format
                 })
 
-            # Read the preprocessed file
+            # Read the preprocessed buffer
             df = pd.read_csv(**read_options)
 
-            # Clean up the temporary file
-            processed_file.unlink()
-
-            return df
+            # Replace commas with dots in numeric fields (the header line is never touched)
+            return self._normalize_decimal_commas(df, skip_first_row=not metadata.header)
 
         except Exception as e:
             logger.error(f"Error reading CSV file {file_path}: {str(e)}")
             raise
 
+    def _read_csv_pyarrow(self, file_path: Path, metadata: ReportMetadata, encoding: str) -> pd.DataFrame:
+        """
+        Read a CSV file with pyarrow.csv (csv_engine='pyarrow').
+
+        All columns are read as strings, like the pandas path (dtype=str). Rows whose field
+        count differs from the first row are skipped instead of truncated/dropped by
+        preprocess_csv.
+
+        Args:
+            file_path (Path): Path to the CSV file
+            metadata (ReportMetadata): File metadata
+            encoding (str): File encoding
+
+        Returns:
+            pd.DataFrame: Loaded data (pyarrow-backed string columns)
+        """
+        delimiter = metadata.delimiter or self.detect_delimiter(file_path, encoding)
+        if delimiter == '\\t':  # Handle escaped tab character
+            delimiter = '\t'
+
+        try:
+            # the first row gives the column names (or count) so every column can be typed as string
+            with open(file_path, 'r', encoding=encoding, newline='') as file:
+                reader = csv.reader(file, delimiter=delimiter)
+                for _ in range(metadata.skip_rows):
+                    next(reader, None)
+                first_row = next(reader, None)
+            if not first_row:
+                raise ValueError(f"No data found in file: {file_path}")
+
+            column_names = first_row if metadata.header else [f"f{i}" for i in range(len(first_row))]
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(
+                    skip_rows=metadata.skip_rows + (1 if metadata.header else 0),
+                    column_names=column_names,
+                    encoding=encoding
+                ),
+                parse_options=pacsv.ParseOptions(
+                    delimiter=delimiter,
+                    quote_char='"',
+                    invalid_row_handler=lambda row: 'skip'
+                ),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={name: pa.string() for name in column_names}
+                )
+            )
+            df = table.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+            if not metadata.header:
+                df.columns = range(len(df.columns))
+
+            # Replace commas with dots in numeric fields (the header line is never touched)
+            return self._normalize_decimal_commas(df, skip_first_row=not metadata.header)
+
+        except Exception as e:
+            logger.error(f"Error reading CSV file {file_path} with pyarrow: {str(e)}")
+            raise
+
     def read_excel_file(self, file_path: Path, metadata: ReportMetadata) -> pd.DataFrame:
         """
         Read Excel file with error handling.
@@ -432,8 +614,10 @@ class FileReader:
         read_options = {
             'io': file_path,
             'sheet_name': metadata.sheet_name or 0,
-            'skip_rows': metadata.skip_rows
+            'skiprows': metadata.skip_rows
         }
+        if EXCEL_ENGINE:
+            read_options['engine'] = EXCEL_ENGINE
 
         try:
             return pd.read_excel(**read_options)
@@ -464,24 +648,24 @@ class FileReader:
             # Validate file
             self.validate_file(file_path, metadata)
 
-            # Detect encoding if not provided
-            encoding = metadata.encoding or self.detect_file_encoding(file_path)
-            logger.info(f"Using encoding: {encoding} for file: {file_path.name}")
-
-            # Read file based on extension
+            # Read file based on extension (Excel is binary: no encoding detection needed)
             file_ext = file_path.suffix.lower()
-
-            if file_ext == '.csv':
-                df = self.read_csv_file(file_path, metadata, encoding)
-            elif file_ext == '.txt':
-                df = self.read_txt_file(file_path, metadata, encoding)
-            elif file_ext in ['.xlsx', '.xls']:
+            if file_ext in _EXCEL_EXTENSIONS:
                 df = self.read_excel_file(file_path, metadata)
-            elif file_ext == '.lst':
-                # Tratar ficheiros .lst como CSV com delimiter específico
-                df = self.read_csv_file(file_path, metadata, encoding)
             else:
-                raise ValueError(f"Unsupported file extension: {file_ext}")
+                reader = _TEXT_READERS.get(file_ext)
+                if reader is None:
+                    raise ValueError(f"Unsupported file extension: {file_ext}")
+
+                # Detect encoding if not provided
+                if metadata.encoding:
+                    encoding = metadata.encoding
+                else:
+                    key = _file_key(file_path)
+                    encoding = _cached_encoding(*key) if key else self.detect_file_encoding(file_path)
+                logger.info(f"Using encoding: {encoding} for file: {file_path.name}")
+
+                df = getattr(self, reader)(file_path, metadata, encoding)
 
             # Validate DataFrame
             if df.empty:
@@ -493,3 +677,91 @@ class FileReader:
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {str(e)}")
             raise
+
+    def read_many(self, items: Iterable[Tuple[Path, ReportMetadata]],
+                  workers: Optional[int] = None) -> List[pd.DataFrame]:
+        """
+        read_file_data over several files in parallel worker processes.
+
+        Args:
+            items: (file_path, metadata) pairs
+            workers (int, optional): Number of processes (default: CPU count); a single
+                file or workers=1 is read in-process
+
+        Returns:
+            List[pd.DataFrame]: One DataFrame per item, in input order
+
+        Raises:
+            Exception: The first read_file_data failure, as in the sequential path
+        """
+        items = list(items)
+        workers = min(workers or os.cpu_count() or 1, len(items))
+        if workers <= 1:
+            return [self.read_file_data(file_path, metadata) for file_path, metadata in items]
+
+        file_paths, metadatas = zip(*items)
+        # FileReader only holds plain settings, so the bound method pickles cheaply
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.read_file_data, file_paths, metadatas))
+
+
+def _count_outside_quotes(line: str, delimiters) -> Dict[str, int]:
+    """Count each delimiter in line, ignoring characters inside double-quoted fields."""
+    if '"' not in line:
+        # sem aspas: um único Counter (em C) sobre a linha serve todos os delimitadores
+        char_counts = Counter(line)
+        return {d: char_counts[d] for d in delimiters}
+
+    counts = dict.fromkeys(delimiters, 0)
+    in_quote = False
+    for ch in line:
+        if ch == '"':
+            in_quote = not in_quote
+        elif not in_quote and ch in counts:
+            counts[ch] += 1
+    return counts
+
+
+@contextmanager
+def _mapped_file(file_path):
+    """Conteúdo do ficheiro como mmap só de leitura (bytes para ficheiros vazios, que não podem ser mapeados)."""
+    with open(file_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            mapped = None
+        if mapped is None:
+            yield f.read()
+            return
+        with mapped:
+            yield mapped
+
+
+@contextmanager
+def _text_lines(file_path, encoding: str):
+    """Iterador sobre as linhas do ficheiro; até READ_ALL_MAX_BYTES o texto é descodificado numa só passagem."""
+    if os.path.getsize(file_path) > READ_ALL_MAX_BYTES:
+        with open(file_path, 'r', encoding=encoding) as f:
+            yield f
+        return
+    # read_text traduz os fins de linha como open(); split('\n') corta nos mesmos pontos que a iteração
+    yield iter(Path(file_path).read_text(encoding=encoding).split('\n'))
+
+
+# Cache de deteção por (caminho, mtime_ns, tamanho): um ficheiro alterado gera uma chave nova
+def _file_key(file_path) -> Optional[Tuple[str, int, int]]:
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return str(file_path), st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=256)
+def _cached_encoding(path_str: str, mtime_ns: int, size: int) -> str:
+    return FileReader.detect_file_encoding(path_str)
+
+
+@lru_cache(maxsize=256)
+def _cached_delimiter(path_str: str, mtime_ns: int, size: int, encoding: str) -> str:
+    return FileReader._sniff_delimiter(Path(path_str), encoding)
@@ -14,6 +14,11 @@ from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
+try:  # fcntl só existe em POSIX; sem ele o lock depende apenas do PID gravado no ficheiro
+    import fcntl
+except ImportError:
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,8 +26,9 @@ class ProcessLock:
     """
     Manages process locking to prevent concurrent executions.
 
-    Uses a PID file to track running processes and verify if they're still active.
-    Automatically releases lock on process exit.
+    Uses a PID file, held under an exclusive flock where fcntl is available, to track
+    running processes and verify if they're still active.
+    Automatically releases a held lock on process exit or SIGTERM/SIGINT.
     """
 
     def __init__(self, lock_dir: str = "/tmp", lock_name: str = "esim_deactivation"):
@@ -35,21 +41,46 @@ class ProcessLock:
         """
         self.lock_file = Path(lock_dir) / f"{lock_name}.lock"
         self.pid = os.getpid()
-        self.locked = False
-
-        # Register cleanup handlers
-        atexit.register(self.release)
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        # fd of the held lock file; None while the lock is not held
+        self._fd: Optional[int] = None
+        # Handlers replaced while the lock is held (restored by release)
+        self._prev_handlers: Optional[dict] = None
 
         logger.debug(f"ProcessLock initialized with file: {self.lock_file}")
 
+    @property
+    def locked(self) -> bool:
+        """True while this instance holds the lock."""
+        return self._fd is not None
+
     def _signal_handler(self, signum, frame):
         """Handle termination signals gracefully."""
         logger.info(f"Received signal {signum}, releasing lock...")
         self.release()
         sys.exit(0)
 
+    def _install_handlers(self) -> None:
+        """Register the exit/signal cleanup while the lock is held, keeping the previous handlers."""
+        if self._prev_handlers is not None:
+            return
+        atexit.register(self.release)
+        self._prev_handlers = {}
+        try:
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                self._prev_handlers[signum] = signal.signal(signum, self._signal_handler)
+        except ValueError:
+            # signal.signal only works in the main thread; atexit still covers normal exit
+            logger.debug("Signal handlers not installed (not in main thread)")
+
+    def _restore_handlers(self) -> None:
+        """Undo _install_handlers."""
+        if self._prev_handlers is None:
+            return
+        atexit.unregister(self.release)
+        for signum, handler in self._prev_handlers.items():
+            signal.signal(signum, handler)
+        self._prev_handlers = None
+
     def acquire(self, force: bool = False) -> bool:
         """
         Acquire the process lock.
@@ -63,30 +94,106 @@ class ProcessLock:
         Raises:
             RuntimeError: If another process is already running (when force=False)
         """
-        if self.locked:
+        if self._fd is not None:
             logger.debug("Lock already held by this process")
             return True
 
-        if self.is_locked() and not force:
-            other_pid = self._read_pid()
-            error_msg = f"Another process (PID: {other_pid}) is already running"
-            logger.error(error_msg)
-            raise RuntimeError(error_msg)
-
         try:
             # Create lock directory if it doesn't exist
             self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to acquire lock: {e}")
+            return False
+
+        # Each attempt returns the locked fd, or None when the lock file was removed
+        # (stale/forced lock, or released by its holder meanwhile) and must be retried once
+        open_locked = self._open_flocked if fcntl is not None else self._open_exclusive
+        for _ in range(2):
+            try:
+                fd = open_locked(force)
+            except RuntimeError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to acquire lock: {e}")
+                return False
+            if fd is None:
+                continue
 
-            # Write PID to lock file
-            self.lock_file.write_text(f"{self.pid}\n{datetime.now().isoformat()}")
-            self.locked = True
+            try:
+                # Write PID to lock file
+                os.pwrite(fd, f"{self.pid}\n{datetime.now().isoformat()}".encode(), 0)
+            except Exception as e:
+                self.lock_file.unlink()
+                os.close(fd)
+                logger.error(f"Failed to acquire lock: {e}")
+                return False
+
+            self._fd = fd
+            self._install_handlers()
 
             logger.info(f"Lock acquired successfully (PID: {self.pid})")
             return True
 
-        except Exception as e:
-            logger.error(f"Failed to acquire lock: {e}")
-            return False
+        logger.error("Failed to acquire lock: lock file recreated by another process")
+        return False
+
+    def _open_flocked(self, force: bool) -> Optional[int]:
+        """
+        Open the lock file and take an exclusive flock on it.
+
+        The kernel drops the flock when the holder dies (even on SIGKILL), so a lock file
+        left behind is simply reused and a recycled PID can never look like a live holder.
+        """
+        fd = os.open(self.lock_file, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            other_pid = self._read_pid()
+            if not force:
+                self._raise_locked(other_pid)
+            logger.warning(f"Removing existing lock file (PID {other_pid})")
+            self._unlink_lock_file()
+            return None
+
+        # The previous holder may have unlinked the file between our open and flock
+        try:
+            same_file = os.stat(self.lock_file).st_ino == os.fstat(fd).st_ino
+        except FileNotFoundError:
+            same_file = False
+        if not same_file:
+            os.close(fd)
+            return None
+
+        os.ftruncate(fd, 0)
+        return fd
+
+    def _open_exclusive(self, force: bool) -> Optional[int]:
+        """
+        Create the lock file with O_CREAT|O_EXCL (platforms without fcntl).
+
+        Check and create happen in one atomic call; an existing file is judged by its PID.
+        """
+        try:
+            return os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_RDWR, 0o644)
+        except FileExistsError:
+            other_pid = self._read_pid()
+            if not force and other_pid is not None and self._is_process_running(other_pid):
+                self._raise_locked(other_pid)
+            logger.warning(f"Removing {'existing' if force else 'stale'} lock file (PID {other_pid})")
+            self._unlink_lock_file()
+            return None
+
+    def _raise_locked(self, other_pid: Optional[int]) -> None:
+        error_msg = f"Another process (PID: {other_pid}) is already running"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg)
+
+    def _unlink_lock_file(self) -> None:
+        try:
+            self.lock_file.unlink()
+        except FileNotFoundError:
+            pass
 
     def release(self) -> bool:
         """
@@ -95,19 +202,27 @@ class ProcessLock:
         Returns:
             True if lock was released, False if it wasn't held
         """
-        if not self.locked:
+        if self._fd is None:
             return False
 
         try:
-            if self.lock_file.exists():
-                # Verify we own the lock before removing
-                if self._read_pid() == self.pid:
-                    self.lock_file.unlink()
-                    logger.info(f"Lock released (PID: {self.pid})")
-                else:
-                    logger.warning("Lock file exists but owned by different process")
-
-            self.locked = False
+            # Unlink while still holding the flock, then close (which drops it).
+            # The path is ours only if it still names the inode behind our fd
+            # (a forced acquire elsewhere replaces the file).
+            try:
+                owned = os.stat(self.lock_file).st_ino == os.fstat(self._fd).st_ino
+            except FileNotFoundError:
+                owned = None
+            if owned:
+                self.lock_file.unlink()
+                logger.info(f"Lock released (PID: {self.pid})")
+            elif owned is False:
+                logger.warning("Lock file exists but owned by different process")
+
+            os.close(self._fd)
+            self._fd = None
+
+            self._restore_handlers()
             return True
 
         except Exception as e:
@@ -118,34 +233,46 @@ class ProcessLock:
         """
         Check if a lock is currently held by any process.
 
+        With fcntl this is a non-destructive flock probe; otherwise the PID in the
+        lock file is checked.
+
         Returns:
             True if a valid lock exists, False otherwise
         """
-        if not self.lock_file.exists():
-            return False
+        if self._fd is not None:
+            return True
 
         try:
-            pid = self._read_pid()
-            if pid is None:
-                return False
+            if fcntl is None:
+                pid = self._read_pid()
+                return pid is not None and self._is_process_running(pid)
 
-            # Check if process is still running
-            if self._is_process_running(pid):
-                return True
-            else:
-                # Stale lock file - remove it
-                logger.warning(f"Removing stale lock file (PID {pid} not running)")
-                self.lock_file.unlink()
+            try:
+                fd = os.open(self.lock_file, os.O_RDONLY)
+            except FileNotFoundError:
                 return False
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+                return False
+            except BlockingIOError:
+                return True
+            finally:
+                os.close(fd)  # closing also drops the probe's own flock
 
         except Exception as e:
             logger.error(f"Error checking lock status: {e}")
             return False
 
+    def _read_lock_content(self) -> str:
+        """Lock file content; read through the held fd when this process owns the lock."""
+        if self._fd is not None:
+            return os.pread(self._fd, 256, 0).decode()
+        return self.lock_file.read_text()
+
     def _read_pid(self) -> Optional[int]:
         """Read PID from lock file."""
         try:
-            content = self.lock_file.read_text().strip()
+            content = self._read_lock_content().strip()
             # PID is on first line
             pid_str = content.split('\n')[0]
             return int(pid_str)
@@ -177,14 +304,14 @@ class ProcessLock:
             return None
 
         try:
-            content = self.lock_file.read_text().strip().split('\n')
+            content = self._read_lock_content().strip().split('\n')
             pid = int(content[0])
             timestamp = content[1] if len(content) > 1 else "Unknown"
 
             return {
                 "pid": pid,
                 "timestamp": timestamp,
-                "is_running": self._is_process_running(pid),
+                "is_running": self.is_locked(),
                 "lock_file": str(self.lock_file)
             }
         except Exception as e:
@@ -200,10 +327,6 @@ class ProcessLock:
         """Context manager exit."""
         self.release()
 
-    def __del__(self):
-        """Cleanup on object destruction."""
-        self.release()
-
 
 # Utility functions for CLI usage
 def check_lock_status(lock_dir: str = "/tmp", lock_name: str = "esim_deactivation") -> None:
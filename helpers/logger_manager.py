@@ -3,6 +3,9 @@ import os
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 
 class LoggerManager:
     """
@@ -28,6 +31,7 @@ class LoggerManager:
         self.log_level = log_level
         self.log_filename = self.generate_log_filename()
         self.logger = None
+        self.formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
         self.setup_logging()
 
     def generate_log_filename(self):
@@ -48,20 +52,14 @@ class LoggerManager:
         if not os.path.exists(self.log_dir):
             os.makedirs(self.log_dir)
 
-        # Configure the basic logging settings
-        logging.basicConfig(
-            level=self.log_level,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S',
-        )
+        # Configure the basic logging settings (skipped if the root logger already has handlers)
+        if not logging.getLogger().handlers:
+            logging.basicConfig(level=self.log_level, format=LOG_FORMAT, datefmt=DATE_FORMAT)
 
         # Create a file handler to log to a file
         file_handler = logging.FileHandler(self.log_filename)
         file_handler.setLevel(self.log_level)
-        file_handler.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            '%Y-%m-%d %H:%M:%S'
-        ))
+        file_handler.setFormatter(self.formatter)
 
         # Get the root logger and add the file handler to it
         root_logger = logging.getLogger()
@@ -87,7 +85,7 @@ class LoggerManager:
         Adds a console handler to the root logger to output log messages to the console.
         """
         console_handler = logging.StreamHandler()
-        self.add_handler(console_handler, '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        self.add_handler(console_handler, LOG_FORMAT)
 
     def add_rotating_file_handler(self, max_bytes=10485760, backup_count=5):
         """
@@ -100,8 +98,7 @@ class LoggerManager:
         rotating_handler = RotatingFileHandler(
             self.log_filename, maxBytes=max_bytes, backupCount=backup_count
         )
-        self.add_handler(
-            rotating_handler, '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        self.add_handler(rotating_handler, LOG_FORMAT)
 
     def add_handler(self, handler, format_str):
         """
@@ -112,8 +109,8 @@ class LoggerManager:
             format_str (str): The format string for the log messages.
         """
         handler.setLevel(self.log_level)
-        handler.setFormatter(logging.Formatter(
-            format_str, '%Y-%m-%d %H:%M:%S'))
+        formatter = self.formatter if format_str == LOG_FORMAT else logging.Formatter(format_str, DATE_FORMAT)
+        handler.setFormatter(formatter)
         logging.getLogger().addHandler(handler)
 
     def get_log_filename(self):
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass
+class ReportMetadata:
+    """Reading options for a source file (see FileReader.read_file_data)."""
+    encoding: Optional[str] = None  # None: detected from the file
+    delimiter: Optional[str] = None  # character or name ('tab', 'semicolon', ...); None: detected
+    skip_rows: int = 0
+    header: bool = True
+    date_format: Optional[str] = None
+    sheet_name: Optional[str] = None  # Excel only; None: first sheet
+    column_widths: Optional[List[int]] = None  # fixed-width TXT files only
@@ -1,7 +1,7 @@
 import asyncio
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from dotenv import load_dotenv
 
 from helpers.configuration import load_ini_config, load_json_config
@@ -68,11 +68,12 @@ def load_etl_config() -> ETLConfig:
     """
 
     db_config = load_ini_config("DATABASE")
-    report = load_json_config().get("report")
-    process = load_json_config().get("process")
-    database = load_json_config().get("database")
-    sap_app = load_json_config().get("sap_app")
-    error_report = load_json_config().get("error_report")
+    json_config = load_json_config()
+    report = json_config.get("report")
+    process = json_config.get("process")
+    database = json_config.get("database")
+    sap_app = json_config.get("sap_app")
+    error_report = json_config.get("error_report")
     smtp_configs = load_ini_config("SMTP")
 
     return ETLConfig(
@@ -96,7 +97,7 @@ async def setup_db_connections():
         - PostgreSQL connection and CRUD object (optional)
     """
     retries = 3  # Number of retries before giving up
-    delay = 5  # Delay in seconds between retries
+    delay = 1  # Initial delay in seconds between retries (doubled on each attempt)
     for attempt in range(retries):
         try:
             logger.info("Setting up database connections...")
@@ -109,10 +110,20 @@ async def setup_db_connections():
             dmkbi_db = DatabaseFactory.get_database('sqlserver', config['dmkbi'])
             postgresql_db = DatabaseFactory.get_database('postgresql', config['postgresql'])
 
-            # Open all connections manually
+            # Open both connections concurrently (blocking handshakes run in worker threads)
             logger.info("Connecting to SQL Server, and PostgreSQL databases...")
-            dmkbi_db.connect()
-            postgresql_db.connect()
+            databases = (dmkbi_db, postgresql_db)
+            outcomes = await asyncio.gather(
+                *(asyncio.to_thread(db.connect) for db in databases),
+                return_exceptions=True
+            )
+            errors = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+            if errors:
+                # Close whichever connection did open before retrying
+                for db, outcome in zip(databases, outcomes):
+                    if not isinstance(outcome, BaseException):
+                        db.disconnect()
+                raise errors[0]
 
             # Create CRUD objects for respective databases
             postgresql_crud = PostgresqlGenericCRUD(postgresql_db)
@@ -123,10 +134,9 @@ async def setup_db_connections():
         except Exception as e:
             logger.error(f"Error setting up database connections: {e}")
             if attempt < retries - 1:
-                await asyncio.sleep(delay)
+                await asyncio.sleep(delay * (2 ** attempt))
             else:
                 raise  # Give up after the last attempt
-            raise
 
 # Ensure to close connections after the entire ETL process is done
 def close_connections(dmkbi_db, postgresql_db):
@@ -154,7 +164,7 @@ async def managed_resources():
     """
 
     # Initialize resources
-    postgresql_db = None
+    dmkbi_db = postgresql_db = None
 
     # Use try-finally to ensure cleanup of resources
     try:
@@ -162,17 +172,17 @@ async def managed_resources():
         config = load_etl_config()
 
         # Setup database connections
-        postgresql_db, postgresql_crud = await setup_db_connections() # Set up database connections
+        dmkbi_db, postgresql_db, postgresql_crud = await setup_db_connections() # Set up database connections
 
         # Return resources to the caller
-        yield config, postgresql_crud, (postgresql_db,)
+        yield config, postgresql_crud, (dmkbi_db, postgresql_db)
 
     finally:
 
         # Close all connections
-        if all((postgresql_db)):
+        if dmkbi_db is not None or postgresql_db is not None:
             logger.info("Closing all database connections...")
-            close_connections(postgresql_db) # Close database connections
+            close_connections(dmkbi_db, postgresql_db) # Close database connections
 
 def get_last_processed_date(postgresql_crud, table: str, process_name: str) -> datetime:
     """
@@ -184,11 +194,11 @@ def get_last_processed_date(postgresql_crud, table: str, process_name: str) -> d
     Returns:
         datetime: The last processed date, or None if no record exists
     """
+    yesterday = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+
     try:
         logger.info("Getting last processed date from control table")
 
-        yesterday = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
-
         # Query the control table to get the last processed date
         result = postgresql_crud.read(
             table,
@@ -198,7 +208,14 @@ def get_last_processed_date(postgresql_crud, table: str, process_name: str) -> d
         )
 
         if result and result[0].get('last_processed_date'):
-            last_date = datetime.strptime(result[0]['last_processed_date'], '%Y-%m-%d')
+            # The CRUD layer formats DATE columns as strings; accept native values as well
+            value = result[0]['last_processed_date']
+            if isinstance(value, datetime):
+                last_date = value
+            elif isinstance(value, date):
+                last_date = datetime.combine(value, datetime.min.time())
+            else:
+                last_date = datetime.strptime(value, '%Y-%m-%d')
             logger.info(f"Last processed date retrieved: {last_date}")
             # Return the day after the last processed date
             return last_date + timedelta(days=1)
@@ -223,44 +240,20 @@ def update_last_processed_date(postgresql_crud, end_date, table: str, process_na
     """
     try:
         logger.info(f"Updating last processed date to {end_date}")
-        # Check if a record already exists
-        result = postgresql_crud.read(
-            table,
-            ['id'],
-            where="process_name = %s",
-            params=(process_name,)
-        )
-
-        # Format the date as string in the expected format
-        date_str = end_date.strftime('%Y-%m-%d')
 
-        if result:
-            # Update existing record
-            success = postgresql_crud.update(
-                table,
-                {'last_processed_date': date_str, 'updated_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')},
-                where="process_name = %s",
-                params=(process_name,)
-            )
-        else:
-            # Get next ID value from sequence
-            id_result = postgresql_crud.execute_raw_query(f"SELECT nextval('{table}_id_seq')")
-            next_id = id_result[0]['nextval']
-
-            # Create new record with explicit ID
-            success = postgresql_crud.create(
-                table,
-                [(
-                    next_id,
-                    process_name,
-                    date_str,
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                )],
-                ['id', 'process_name', 'last_processed_date', 'created_at', 'updated_at']
-            )
+        # Single atomic upsert on the UNIQUE process_name (id comes from the SERIAL default)
+        postgresql_crud.execute_raw_query(
+            f"""
+            INSERT INTO {table} (process_name, last_processed_date, created_at, updated_at)
+            VALUES (%s, %s, NOW(), NOW())
+            ON CONFLICT (process_name) DO UPDATE
+            SET last_processed_date = EXCLUDED.last_processed_date, updated_at = NOW()
+            """,
+            # psycopg2 adapts date values natively: no client-side formatting needed
+            (process_name, end_date.date() if isinstance(end_date, datetime) else end_date)
+        )
 
-        return success
+        return True
     except Exception as e:
         logger.error(f"Error updating last processed date: {e}")
         return False
@@ -273,23 +266,15 @@ def ensure_control_table_exists(postgresql_crud, table: str) -> None:
         postgresql_crud: PostgreSQL CRUD handler
         table: Name of the control table to create
     """
-    try:
-        # Check if table exists by trying to read from it
-        postgresql_crud.read(table, ['id'], where="1=0")
-        logger.info(f"ETL control table {table} already exists")
-    except Exception:
-        # Create the table if it doesn't exist
-        logger.info(f"Creating ETL control table {table}")
-
-        # Use an f-string to format the table name
-        create_table_query = f"""
-        CREATE TABLE IF NOT EXISTS {table} (
-            id SERIAL PRIMARY KEY,
-            process_name VARCHAR(50) NOT NULL UNIQUE,
-            last_processed_date DATE NOT NULL,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-        );
-        """
-        postgresql_crud.execute_raw_query(create_table_query)
-        logger.info(f"ETL control table {table} created successfully")
+    # CREATE TABLE IF NOT EXISTS is idempotent: no need for a probe query first
+    create_table_query = f"""
+    CREATE TABLE IF NOT EXISTS {table} (
+        id SERIAL PRIMARY KEY,
+        process_name VARCHAR(50) NOT NULL UNIQUE,
+        last_processed_date DATE NOT NULL,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    );
+    """
+    postgresql_crud.execute_raw_query(create_table_query)
+    logger.info(f"ETL control table {table} ensured")
@@ -0,0 +1,112 @@
+# tests/test_esim_rsp_client.py
+import pytest
+import requests
+import time
+
+from core.business_rules import RetryPolicy
+from core.esim_rsp_client import ESIMRSPClient
+
+
+def test_expire_order_success(monkeypatch):
+    """
+    Quando _make_request retorna sucesso, expire_order deve:
+    - retornar status == "success"
+    - enviar o endpoint e body corretos
+    - incluir finalProfileStatusIndicator == "Unavailable"
+    """
+    client = ESIMRSPClient(environment="test", env_path=None)
+
+    captured = {}
+
+    def fake_make_request(endpoint, method='POST', body=None):
+        # armazenar para assert posterior e simular resposta do RSP
+        captured['endpoint'] = endpoint
+        captured['method'] = method
+        captured['body'] = body
+        return {"header": {"functionExecutionStatus": {"status": "Executed-Success"}}}
+
+    monkeypatch.setattr(client, "_make_request", fake_make_request)
+
+    iccid = "89238010000101567890"
+    result = client.expire_order(iccid=iccid)
+
+    assert result["status"] == "success"
+    # endpoint deve corresponder ao path da ExpireOrder conforme documentação
+    assert captured["endpoint"].endswith("/order/expire")
+    assert captured["method"] == "POST"
+    assert isinstance(captured["body"], dict)
+    assert captured["body"].get("iccid") == iccid
+    assert captured["body"].get("finalProfileStatusIndicator").lower() == "unavailable"
+    # header.functionCallIdentifier deve ser expireOrder
+    header = captured["body"].get("header", {})
+    assert header.get("functionCallIdentifier") == "expireOrder"
+    assert "functionRequesterIdentifier" in header
+
+
+def test_expire_order_retry_and_fail(monkeypatch):
+    """
+    Simula falha de ligação persistente na API (transitória, logo retentada):
+    - monkeypatch _make_request para lançar uma ConnectionError sempre
+    - monkeypatch time.sleep para acelerar o teste
+    - verificar que expire_order retorna status 'failed' e attempts == max_attempts
+    """
+    client = ESIMRSPClient(environment="test", env_path=None)
+
+    call_count = {"n": 0}
+
+    def fake_make_request_fail(endpoint, method='POST', body=None):
+        call_count["n"] += 1
+        raise requests.ConnectionError("simulated failure")
+
+    monkeypatch.setattr(client, "_make_request", fake_make_request_fail)
+    # prevenir delays reais
+    monkeypatch.setattr(time, "sleep", lambda s: None)
+
+    iccid = "89238010000101567890"
+    result = client.expire_order(iccid=iccid)
+
+    assert result["status"] == "failed"
+    # attempts devolvido deve ser igual ao máximo de tentativas da retry policy
+    assert result["attempts"] == client.retry_policy.max_attempts
+    # confirmar que _make_request foi chamado o número esperado de vezes
+    assert call_count["n"] == client.retry_policy.max_attempts
+
+
+def test_batch_expire_keeps_input_order(monkeypatch):
+    """
+    batch_expire devolve um resultado por ICCID, pela ordem de entrada:
+    - as falhas tratadas por expire_order aparecem como status 'failed' na sua posição
+    - uma exceção inesperada de expire_order é propagada ao chamador
+    """
+    # sem esperas entre tentativas
+    policy = RetryPolicy(max_attempts=2, delay_seconds=0, jitter=0)
+    client = ESIMRSPClient(environment="test", env_path=None, retry_policy=policy, batch_workers=4)
+    failing = "89238010000101000003"
+
+    def fake_make_request(endpoint, method='POST', body=None):
+        # respostas fora de ordem: a primeira ICCID é a última a concluir
+        if body["iccid"].endswith("1"):
+            time.sleep(0.05)
+        if body["iccid"] == failing:
+            raise requests.ConnectionError("simulated failure")
+        return {"iccid": body["iccid"]}
+
+    monkeypatch.setattr(client, "_make_request", fake_make_request)
+
+    iccids = [f"8923801000010100000{i}" for i in range(1, 6)]
+    results = client.batch_expire(iccids)
+
+    assert [r["iccid"] for r in results] == iccids
+    assert [r["status"] for r in results] == ["success", "success", "failed", "success", "success"]
+    assert results[0]["response"] == {"iccid": iccids[0]}
+
+    def fake_expire_order(iccid, final_status="Unavailable"):
+        if iccid == failing:
+            raise RuntimeError("unexpected")
+        return {"iccid": iccid, "status": "success"}
+
+    monkeypatch.setattr(client, "expire_order", fake_expire_order)
+    with pytest.raises(RuntimeError, match="unexpected"):
+        client.batch_expire(iccids)
+
+    client.close()
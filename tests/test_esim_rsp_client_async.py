@@ -0,0 +1,98 @@
+# tests/test_esim_rsp_client_async.py
+import asyncio
+
+import orjson
+
+from core.business_rules import RetryPolicy
+from core.esim_rsp_client_async import AsyncESIMRSPClient
+
+
+class FakeResponse:
+    """Resposta mínima com a interface usada por AsyncESIMRSPClient._make_request."""
+
+    def __init__(self, status, payload):
+        self.status = status
+        self.reason = "OK" if status < 400 else "Error"
+        self._content = orjson.dumps(payload)
+
+    async def read(self):
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeSession:
+    """
+    Substitui aiohttp.ClientSession: `reply(body)` devolve (status, payload) para cada pedido
+    e os pedidos ficam registados em `calls`.
+    """
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = []
+
+    def request(self, method, url, headers=None, data=None):
+        body = orjson.loads(data)
+        self.calls.append({"method": method, "url": url, "headers": dict(headers), "body": body})
+        return FakeResponse(*self.reply(body))
+
+    async def close(self):
+        pass
+
+
+def make_client(reply):
+    # sem esperas entre tentativas
+    policy = RetryPolicy(max_attempts=3, delay_seconds=0, jitter=0)
+    client = AsyncESIMRSPClient(environment="test", env_path=None, retry_policy=policy)
+    client._session = FakeSession(reply)
+    return client
+
+
+def test_async_expire_order_success():
+    """expire_order envia o body ES2+ assinado e devolve status 'success'."""
+    client = make_client(lambda body: (200, {"header": {"functionExecutionStatus": {"status": "Executed-Success"}}}))
+
+    iccid = "89238010000101567890"
+    result = asyncio.run(client.expire_order(iccid))
+
+    assert result["status"] == "success"
+    assert result["attempts"] == 1
+    (call,) = client._session.calls
+    assert call["method"] == "POST"
+    assert call["url"].endswith("/order/expire")
+    assert call["body"]["iccid"] == iccid
+    assert call["body"]["finalProfileStatusIndicator"] == "Unavailable"
+    assert call["body"]["header"]["functionCallIdentifier"] == "expireOrder"
+    assert {"Request-ID", "Timestamp", "Signature"} <= set(call["headers"])
+
+
+def test_async_expire_order_retries_only_transient():
+    """Um 503 é retentado até max_attempts; um 400 falha logo na primeira tentativa."""
+    client = make_client(lambda body: (503, {"error": "unavailable"}))
+    result = asyncio.run(client.expire_order("89238010000101567890"))
+    assert result["status"] == "failed"
+    assert result["attempts"] == 3
+    assert len(client._session.calls) == 3
+
+    client = make_client(lambda body: (400, {"error": "bad request"}))
+    result = asyncio.run(client.expire_order("89238010000101567890"))
+    assert result["status"] == "failed"
+    assert result["attempts"] == 1
+    assert len(client._session.calls) == 1
+
+
+def test_async_expire_many_keeps_input_order():
+    """expire_many devolve um resultado por ICCID, na ordem de entrada, incluindo as falhas."""
+    failing = "89238010000101000002"
+    client = make_client(lambda body: (400, {}) if body["iccid"] == failing else (200, {"iccid": body["iccid"]}))
+
+    iccids = ["89238010000101000001", failing, "89238010000101000003"]
+    results = asyncio.run(client.expire_many(iccids))
+
+    assert [r["iccid"] for r in results] == iccids
+    assert [r["status"] for r in results] == ["success", "failed", "success"]
+    assert results[2]["response"] == {"iccid": iccids[2]}
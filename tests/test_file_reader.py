@@ -0,0 +1,43 @@
+# tests/test_file_reader.py
+import os
+import sys
+from pathlib import Path
+
+# Ensure the project root directory to sys.path if it's not already there
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from helpers.file_reader import FileReader
+from helpers.models import ReportMetadata
+
+
+def test_read_csv_file(tmp_path):
+    path = tmp_path / "iccids.csv"
+    path.write_text("iccid;valor\n89238010000101000001;1,5\n89238010000101000002;2\n", encoding="utf-8")
+
+    df = FileReader().read_file_data(Path(path), ReportMetadata(delimiter=";"))
+
+    assert df.to_dict("list") == {
+        "iccid": ["89238010000101000001", "89238010000101000002"],
+        "valor": ["1.5", "2"],
+    }
+
+
+def test_read_txt_file_strips_lines(tmp_path):
+    """Uma linha iniciada pelo delimitador não desloca as colunas (cada linha é limpa antes da divisão)."""
+    path = tmp_path / "iccids.txt"
+    path.write_text("a\tb\n\tx\ty\n1\t2  \n", encoding="utf-8")
+
+    df = FileReader().read_file_data(Path(path), ReportMetadata(delimiter="tab", encoding="utf-8"))
+
+    assert df.to_dict("list") == {"a": ["x", "1"], "b": ["y", "2"]}
+
+
+def test_read_txt_file_space_delimited(tmp_path):
+    path = tmp_path / "iccids.txt"
+    path.write_text("# exportado\niccid   estado\n89238010000101000001  ACTIVE\n", encoding="utf-8")
+
+    df = FileReader().read_file_data(Path(path), ReportMetadata(delimiter="space", skip_rows=1))
+
+    assert df.to_dict("list") == {"iccid": ["89238010000101000001"], "estado": ["ACTIVE"]}
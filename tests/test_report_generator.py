@@ -0,0 +1,69 @@
+# tests/test_report_generator.py
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# Ensure the project root directory to sys.path if it's not already there
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from core import report_generator
+from core.report_generator import CSV_FIELDS, ProcessingResult, ReportGenerator
+
+
+def make_results():
+    return [
+        ProcessingResult(
+            iccid="89238010000101000001",
+            imsi="238011234567890",
+            msisdn="351910000001",
+            file_source="test.xml",
+            timestamp=datetime(2025, 1, 2, 3, 4, 5),
+            status="SUCCESS",
+            api_response={"header": {"functionExecutionStatus": {"status": "Executed-Success"}}},
+            success_reason="EXPIRED",
+            processing_time_ms=100
+        ),
+        ProcessingResult(
+            iccid="89238010000101000002",
+            imsi=None,
+            msisdn=None,
+            file_source="test.xml",
+            timestamp=datetime(2025, 1, 2, 3, 4, 6),
+            status="FAILED",
+            error_message='API timeout, "retry"\nlater',
+            retry_attempts=3,
+            processing_time_ms=5000
+        ),
+    ]
+
+
+def test_to_dict_matches_csv_fields():
+    result = make_results()[0]
+    data = result.to_dict()
+
+    assert tuple(data) == CSV_FIELDS
+    assert data["timestamp"] == "2025-01-02 03:04:05"
+    assert data["api_response"] == '{"header": {"functionExecutionStatus": {"status": "Executed-Success"}}}'
+    assert data["success_reason"] == "EXPIRED"
+    assert make_results()[1].to_dict()["api_response"] is None
+
+
+def test_polars_csv_matches_csv_module(tmp_path, monkeypatch):
+    """Com polars instalado, os CSV (detalhado e resumo) são idênticos byte a byte aos do módulo csv."""
+    pytest.importorskip("polars")
+    results = make_results()
+    generator = ReportGenerator(report_dir=str(tmp_path))
+
+    polars_paths = (generator.generate_csv(results, "polars.csv"),
+                    generator.generate_summary_csv(results, "polars_summary.csv"))
+    monkeypatch.setattr(report_generator, "pl", None)
+    csv_paths = (generator.generate_csv(results, "stdlib.csv"),
+                 generator.generate_summary_csv(results, "stdlib_summary.csv"))
+
+    for polars_path, csv_path in zip(polars_paths, csv_paths):
+        with open(polars_path, "rb") as a, open(csv_path, "rb") as b:
+            assert a.read() == b.read()